@@ -7,11 +7,25 @@ This module contains the advanced visual components
 
 import tkinter as tk
 from tkinter import ttk, Canvas, Frame, Label
+import os
+import sys
+import json
+import mmap
 import time
 import math
+import functools
+import threading
+import numpy as np
 from typing import Optional, Callable, List
+from collections import deque, OrderedDict
 from datetime import datetime
 
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
 # ============================================================================
 # ENHANCED SCI-FI THEME SYSTEM
 # ============================================================================
@@ -92,6 +106,569 @@ class EnhancedSciFiTheme:
         "#00bb00", "#00cc00", "#00dd00", "#00ee00"
     ]
 
+# ============================================================================
+# SHARED FRAME SCHEDULER
+# ============================================================================
+
+class FrameSubscription:
+    """Handle for a callback registered with a FrameScheduler"""
+
+    def __init__(self, scheduler, owner, callback, interval_ms, decorative=False):
+        self.scheduler = scheduler
+        self.owner = owner
+        self.callback = callback
+        self.name = getattr(callback, '__name__', 'callback')
+        self.interval_ms = interval_ms
+        self.decorative = decorative
+        self.next_due = 0.0
+        self.active = True
+
+    def cancel(self):
+        """Stop receiving frames"""
+        self.scheduler.unsubscribe(self)
+
+
+class FrameScheduler:
+    """Single animation clock shared by every widget under one Tk root
+
+    Subscribers of hidden or obscured widgets are skipped until they are visible again.
+    """
+
+    DEFAULT_FPS = 30
+    LATENESS_SAMPLES = 256
+
+    def __init__(self, root, fps=DEFAULT_FPS):
+        self.root = root
+        self.fps = fps
+        self.frame_ms = 1000.0 / fps
+        self.frame_count = 0
+        self.subscriptions: List[FrameSubscription] = []
+        self.decorative_scale = 1.0
+        # How late each wakeup fired relative to when it was requested, in ms
+        self.lateness_ms = deque(maxlen=self.LATENESS_SAMPLES)
+        self._owners = set()
+        self._obscured = set()
+        self._visible = {}
+        self._visibility_dirty = True
+        self._after_id = None
+        self._wake_at = None
+
+        # Any map/unmap in the application can change which owners are viewable
+        root.bind_all('<Map>', self._on_map_change, add='+')
+        root.bind_all('<Unmap>', self._on_map_change, add='+')
+
+    @classmethod
+    def for_widget(cls, widget) -> 'FrameScheduler':
+        """Return the scheduler for a widget's Tk root, creating it on first use"""
+        root = widget._root()
+        scheduler = getattr(root, '_frame_scheduler', None)
+        if scheduler is None:
+            scheduler = cls(root)
+            root._frame_scheduler = scheduler
+        return scheduler
+
+    def set_fps(self, fps):
+        """Set the global frame rate; subscribers never run faster than this"""
+        self.fps = max(1, fps)
+        self.frame_ms = 1000.0 / self.fps
+
+    def set_decorative_scale(self, scale):
+        """Stretch the interval of every decorative subscription by `scale`"""
+        self.decorative_scale = max(1.0, scale)
+
+    def subscribe(self, owner, callback: Callable, interval_ms,
+                  decorative=False) -> FrameSubscription:
+        """Call `callback` every `interval_ms` until cancelled or `owner` is destroyed"""
+        subscription = FrameSubscription(self, owner, callback, interval_ms, decorative)
+        subscription.next_due = time.perf_counter()
+        self.subscriptions.append(subscription)
+        self.watch(owner)
+
+        self._schedule(0)
+        return subscription
+
+    def watch(self, widget):
+        """Track a widget's visibility and forget it when it is destroyed"""
+        if widget in self._owners:
+            return
+
+        self._owners.add(widget)
+        self._visibility_dirty = True
+        widget.bind('<Destroy>',
+                    lambda event, w=widget: self._on_owner_destroyed(event, w),
+                    add='+')
+        widget.bind('<Visibility>',
+                    lambda event, w=widget: self._on_visibility(event, w),
+                    add='+')
+
+    def unsubscribe(self, subscription: FrameSubscription):
+        """Remove a subscription"""
+        subscription.active = False
+        if subscription in self.subscriptions:
+            self.subscriptions.remove(subscription)
+
+    def _on_owner_destroyed(self, event, owner):
+        """Drop every subscription of a destroyed widget"""
+        if event.widget is not owner:
+            return
+
+        self._owners.discard(owner)
+        self._obscured.discard(owner)
+        self._visible.pop(owner, None)
+        for subscription in [s for s in self.subscriptions if s.owner is owner]:
+            self.unsubscribe(subscription)
+
+    def is_visible(self, owner):
+        """Whether a subscribed or watched widget is currently on screen"""
+        if self._visibility_dirty:
+            self._refresh_visibility()
+        return self._visible.get(owner, False)
+
+    def _on_map_change(self, event):
+        """Re-check owner visibility on the next frame"""
+        self._visibility_dirty = True
+        self._schedule(0)
+
+    def _on_visibility(self, event, owner):
+        """Track owners that the window manager reports as fully obscured"""
+        if event.state == 'VisibilityFullyObscured':
+            self._obscured.add(owner)
+        else:
+            self._obscured.discard(owner)
+        self._on_map_change(event)
+
+    def _refresh_visibility(self):
+        """Query viewability once per map change rather than every frame"""
+        self._visibility_dirty = False
+        for owner in self._owners:
+            try:
+                viewable = bool(owner.winfo_viewable())
+            except tk.TclError:
+                viewable = False
+            self._visible[owner] = viewable and owner not in self._obscured
+
+    def _schedule(self, delay_ms):
+        """Arm the timer unless it already fires sooner"""
+        wake_at = time.perf_counter() + delay_ms / 1000.0
+        if self._after_id is not None:
+            if self._wake_at <= wake_at:
+                return
+            self.root.after_cancel(self._after_id)
+
+        self._wake_at = wake_at
+        self._after_id = self.root.after(max(1, int(delay_ms)), self._tick)
+
+    def _tick(self):
+        """Run one frame: call every subscriber that is due"""
+        self._after_id = None
+        now = time.perf_counter()
+        if self._wake_at is not None:
+            self.lateness_ms.append(max(0.0, (now - self._wake_at) * 1000.0))
+        # Anything due within half a frame runs now rather than a frame late
+        horizon = now + self.frame_ms / 2000.0
+        self.frame_count += 1
+
+        if self._visibility_dirty:
+            self._refresh_visibility()
+
+        for subscription in list(self.subscriptions):
+            if not subscription.active or subscription.next_due > horizon:
+                continue
+            if not self._visible.get(subscription.owner, False):
+                continue
+
+            interval = subscription.interval_ms / 1000.0
+            if subscription.decorative:
+                interval *= self.decorative_scale
+            subscription.next_due += interval
+            if subscription.next_due < now:
+                # Fell behind: skip the missed frames instead of bursting
+                subscription.next_due = now + interval
+
+            started = time.perf_counter()
+            try:
+                subscription.callback()
+            except Exception:
+                # Same outcome as an exception in a private after() loop:
+                # report it and stop animating that widget only
+                self.unsubscribe(subscription)
+                self.root.report_callback_exception(*sys.exc_info())
+
+            if PERF_MONITOR.enabled:
+                PERF_MONITOR.record(subscription.owner, subscription.name,
+                                    time.perf_counter() - started)
+
+        # Sleep while nothing visible is subscribed; a <Map> wakes us up
+        visible = [s for s in self.subscriptions if self._visible.get(s.owner, False)]
+        if visible:
+            next_due = min(s.next_due for s in visible)
+            delay_ms = (next_due - time.perf_counter()) * 1000.0
+            self._schedule(max(self.frame_ms, delay_ms))
+
+# ============================================================================
+# LATEST-WINS MAILBOX
+# ============================================================================
+
+class LatestWinsMailbox:
+    """Thread-safe single-slot hand-off from worker threads to the GUI"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._value = None
+        self._pending = False
+        self.published = 0
+        self.dropped = 0  # values replaced before the GUI took them
+
+    def publish(self, value):
+        """Offer a new value, replacing any the GUI has not taken yet"""
+        with self._lock:
+            if self._pending:
+                self.dropped += 1
+            self._value = value
+            self._pending = True
+            self.published += 1
+
+    def take(self):
+        """Return (True, newest value) once per publish, else (False, None)"""
+        with self._lock:
+            if not self._pending:
+                return False, None
+            value, self._value = self._value, None
+            self._pending = False
+            return True, value
+
+# ============================================================================
+# ADAPTIVE FRAME RATE GOVERNOR
+# ============================================================================
+
+class FrameRateGovernor:
+    """Trades decorative animation for headroom when the host is busy"""
+
+    # (decorative interval scale, render quality) per level
+    LEVELS = (
+        (1.0, 1.0),
+        (2.0, 1.0),
+        (3.0, 0.5),
+        (4.0, 0.25),
+    )
+
+    EVALUATE_MS = 1000
+    CPU_HIGH = 85.0
+    CPU_LOW = 60.0
+    LATENESS_HIGH_MS = 20.0
+    LATENESS_LOW_MS = 5.0
+    STEP_DOWN_AFTER = 2  # consecutive evaluations under pressure
+    STEP_UP_AFTER = 5    # consecutive evaluations with headroom
+
+    def __init__(self, scheduler):
+        self.scheduler = scheduler
+        self.level = 0
+        self.cpu_percent = 0.0
+        self.lateness_ms = 0.0
+        self.widgets = set()
+        self._pressure_count = 0
+        self._headroom_count = 0
+
+        # Own CPU-times baseline: psutil.cpu_percent(interval=None) measures
+        # from whichever caller in the process sampled last
+        self._cpu_times = psutil.cpu_times() if PSUTIL_AVAILABLE else None
+
+        self.clock = scheduler.subscribe(scheduler.root, self._evaluate, self.EVALUATE_MS)
+
+    @classmethod
+    def for_widget(cls, widget) -> 'FrameRateGovernor':
+        """Return the governor for a widget's Tk root, creating it on first use"""
+        root = widget._root()
+        governor = getattr(root, '_frame_governor', None)
+        if governor is None:
+            governor = cls(FrameScheduler.for_widget(widget))
+            root._frame_governor = governor
+        return governor
+
+    @property
+    def render_quality(self):
+        """Detail fraction decorative widgets should currently draw"""
+        return self.LEVELS[self.level][1]
+
+    def register(self, widget):
+        """Keep a widget's set_render_quality() in step with the level"""
+        self.widgets.add(widget)
+        widget.bind('<Destroy>',
+                    lambda event, w=widget: self.widgets.discard(w) if event.widget is w else None,
+                    add='+')
+        widget.set_render_quality(self.render_quality)
+
+    def set_level(self, level):
+        """Apply a degradation level (0 = full rate and quality)"""
+        level = max(0, min(len(self.LEVELS) - 1, level))
+        if level == self.level:
+            return
+
+        previous_quality = self.render_quality
+        self.level = level
+        scale, quality = self.LEVELS[level]
+        self.scheduler.set_decorative_scale(scale)
+
+        if quality != previous_quality:
+            for widget in list(self.widgets):
+                widget.set_render_quality(quality)
+
+    def _sample_cpu(self):
+        """System CPU use in percent since the previous evaluation"""
+        if not PSUTIL_AVAILABLE:
+            return 0.0
+
+        times = psutil.cpu_times()
+        previous, self._cpu_times = self._cpu_times, times
+        idle = ('idle', 'iowait')
+        counted_twice = ('guest', 'guest_nice')  # Linux includes these in user/nice
+        busy = sum(getattr(times, field) - getattr(previous, field)
+                   for field in times._fields if field not in idle + counted_twice)
+        total = busy + sum(getattr(times, field, 0.0) - getattr(previous, field, 0.0)
+                           for field in idle)
+        return 100.0 * busy / total if total > 0 else 0.0
+
+    def _evaluate(self):
+        """Step the level from the last second of lateness and CPU samples"""
+        samples = sorted(self.scheduler.lateness_ms)
+        self.scheduler.lateness_ms.clear()
+        self.lateness_ms = samples[int(0.9 * (len(samples) - 1))] if samples else 0.0
+        self.cpu_percent = self._sample_cpu()
+
+        if self.cpu_percent >= self.CPU_HIGH or self.lateness_ms >= self.LATENESS_HIGH_MS:
+            self._pressure_count += 1
+            self._headroom_count = 0
+        elif self.cpu_percent <= self.CPU_LOW and self.lateness_ms <= self.LATENESS_LOW_MS:
+            self._headroom_count += 1
+            self._pressure_count = 0
+        else:
+            self._pressure_count = self._headroom_count = 0
+
+        if self._pressure_count >= self.STEP_DOWN_AFTER:
+            self._pressure_count = 0
+            self.set_level(self.level + 1)
+        elif self._headroom_count >= self.STEP_UP_AFTER:
+            self._headroom_count = 0
+            self.set_level(self.level - 1)
+
+# ============================================================================
+# PERFORMANCE INSTRUMENTATION
+# ============================================================================
+
+class CallbackStats:
+    """Call count and recent run times of one widget callback"""
+
+    SAMPLE_SIZE = 512
+
+    def __init__(self):
+        self.calls = 0
+        self.total_ms = 0.0
+        self.durations = deque(maxlen=self.SAMPLE_SIZE)  # ms, most recent calls
+
+    def add(self, duration_ms):
+        """Record one call"""
+        self.calls += 1
+        self.total_ms += duration_ms
+        self.durations.append(duration_ms)
+
+    def percentiles(self):
+        """p50/p95/p99 of the recent run times in ms"""
+        ordered = sorted(self.durations)
+        if not ordered:
+            return {'p50': 0.0, 'p95': 0.0, 'p99': 0.0}
+
+        def pick(fraction):
+            return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+        return {'p50': pick(0.50), 'p95': pick(0.95), 'p99': pick(0.99)}
+
+
+class WidgetStats:
+    """Callback timings and canvas item counts of one widget"""
+
+    HISTORY_SIZE = 300  # item count samples kept (5 minutes at 1 Hz)
+
+    def __init__(self, widget):
+        self.name = f"{type(widget).__name__} {widget}"
+        self.alive = True
+        self.callbacks = {}
+        self.item_history = deque(maxlen=self.HISTORY_SIZE)  # (timestamp, items)
+        self.peak_items = 0
+        self.created_per_sec = 0.0
+        self.deleted_per_sec = 0.0
+        self._last_probe = None
+        self._last_sample = None
+
+    def to_dict(self):
+        """JSON-friendly snapshot"""
+        items = self.item_history[-1][1] if self.item_history else None
+        growth_per_min = 0.0
+        if len(self.item_history) > 1:
+            (t0, n0), (t1, n1) = self.item_history[0], self.item_history[-1]
+            if t1 > t0:
+                growth_per_min = (n1 - n0) * 60.0 / (t1 - t0)
+
+        return {
+            'widget': self.name,
+            'alive': self.alive,
+            'callbacks': {name: dict(calls=stats.calls,
+                                     total_ms=round(stats.total_ms, 3),
+                                     **{k: round(v, 3) for k, v in stats.percentiles().items()})
+                          for name, stats in self.callbacks.items()},
+            'items': items,
+            'peak_items': self.peak_items,
+            'item_growth_per_min': round(growth_per_min, 2),
+            'created_per_sec': round(self.created_per_sec, 2),
+            'deleted_per_sec': round(self.deleted_per_sec, 2),
+            'item_history': [n for _, n in self.item_history],
+        }
+
+
+class PerformanceMonitor:
+    """Per-widget callback timing and canvas item instrumentation"""
+
+    SAMPLE_INTERVAL_MS = 1000
+
+    def __init__(self):
+        self.enabled = False
+        self.widgets = {}   # widget -> WidgetStats
+        self.canvases = {}  # widget -> canvas whose items are sampled
+        self._samplers = {}  # scheduler -> sampling subscription
+
+    def enable(self):
+        """Start recording"""
+        self.enabled = True
+        for widget in self.canvases:
+            self._ensure_sampler(widget)
+
+    def disable(self):
+        """Stop recording; collected statistics are kept"""
+        self.enabled = False
+        for subscription in self._samplers.values():
+            subscription.cancel()
+        self._samplers.clear()
+
+    def reset(self):
+        """Forget all collected statistics"""
+        for widget, stats in list(self.widgets.items()):
+            if not stats.alive:
+                del self.widgets[widget]
+                continue
+            self.widgets[widget] = WidgetStats(widget)
+
+    def record(self, widget, callback_name, seconds):
+        """Record one run of a widget callback"""
+        stats = self.widgets.get(widget)
+        if stats is None:
+            stats = self._watch(widget)
+
+        callback = stats.callbacks.get(callback_name)
+        if callback is None:
+            callback = stats.callbacks[callback_name] = CallbackStats()
+        callback.add(seconds * 1000.0)
+
+    def _watch(self, widget):
+        """Start tracking a widget and, if it draws on a canvas, its items"""
+        stats = self.widgets[widget] = WidgetStats(widget)
+
+        canvas = widget if isinstance(widget, Canvas) else getattr(widget, 'canvas', None)
+        if isinstance(canvas, Canvas):
+            self.canvases[widget] = canvas
+            self._ensure_sampler(widget)
+
+        widget.bind('<Destroy>',
+                    lambda event, w=widget: self._forget(w) if event.widget is w else None,
+                    add='+')
+        return stats
+
+    def _forget(self, widget):
+        """Stop sampling a destroyed widget; its statistics are kept"""
+        self.canvases.pop(widget, None)
+        if widget in self.widgets:
+            self.widgets[widget].alive = False
+
+    def _ensure_sampler(self, widget):
+        """Make sure the widget's scheduler samples item counts"""
+        scheduler = FrameScheduler.for_widget(widget)
+        if self.enabled and scheduler not in self._samplers:
+            def sample_items():
+                self.sample(scheduler)
+
+            self._samplers[scheduler] = scheduler.subscribe(
+                scheduler.root, sample_items, self.SAMPLE_INTERVAL_MS)
+
+    def sample(self, scheduler=None):
+        """Sample item counts and churn of every watched canvas"""
+        now = time.perf_counter()
+        for widget, canvas in list(self.canvases.items()):
+            if scheduler is not None and canvas._root() is not scheduler.root:
+                continue
+
+            stats = self.widgets[widget]
+            try:
+                items = len(canvas.find_all())
+                # Item ids are sequential per canvas, so the id of a throwaway
+                # probe tells how many items were created since the last one
+                probe = canvas.create_line(0, 0, 0, 0)
+                canvas.delete(probe)
+            except tk.TclError:
+                continue
+
+            if stats._last_probe is not None:
+                elapsed = now - stats._last_sample
+                created = probe - stats._last_probe - 1
+                deleted = created - (items - stats.item_history[-1][1])
+                if elapsed > 0:
+                    stats.created_per_sec = created / elapsed
+                    stats.deleted_per_sec = deleted / elapsed
+
+            stats._last_probe = probe
+            stats._last_sample = now
+            stats.item_history.append((now, items))
+            stats.peak_items = max(stats.peak_items, items)
+
+    def snapshot(self):
+        """Statistics for every widget, busiest first"""
+        rows = [stats.to_dict() for stats in self.widgets.values()]
+        rows.sort(key=lambda row: sum(c['total_ms'] for c in row['callbacks'].values()),
+                  reverse=True)
+        return rows
+
+    def to_dict(self):
+        """JSON-friendly snapshot of everything recorded"""
+        return {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'enabled': self.enabled,
+            'widgets': self.snapshot(),
+        }
+
+    def dump_json(self, path):
+        """Write the snapshot to a JSON file"""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+# Process-wide monitor used by FrameScheduler and @instrumented
+PERF_MONITOR = PerformanceMonitor()
+
+
+def instrumented(method):
+    """Time a widget draw method in PERF_MONITOR while profiling is enabled"""
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not PERF_MONITOR.enabled:
+            return method(self, *args, **kwargs)
+
+        started = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            PERF_MONITOR.record(self, name, time.perf_counter() - started)
+
+    return wrapper
+
 # ============================================================================
 # ANIMATED BORDER FRAME
 # ============================================================================
@@ -99,6 +676,9 @@ class EnhancedSciFiTheme:
 class AnimatedBorderFrame(Frame):
     """Frame with animated glowing border"""
 
+    BORDER_THICKNESS = 3
+    CORNER_SIZE = 20
+
     def __init__(self, parent, border_color=EnhancedSciFiTheme.BORDER_PRIMARY,
                  animation_speed=EnhancedSciFiTheme.ANIM_MEDIUM, **kwargs):
         super().__init__(parent, **kwargs)
@@ -107,6 +687,11 @@ class AnimatedBorderFrame(Frame):
         self.animation_speed = animation_speed
         self.animation_state = 0
         self.animating = False
+        self.clock = None
+
+        # Border items are created once and then recoloured/resized in place
+        self.border_rect = None
+        self.border_color_drawn = None
 
         # Create canvas for border
         self.canvas = Canvas(self, bg=EnhancedSciFiTheme.BG_BLACK,
@@ -115,51 +700,90 @@ class AnimatedBorderFrame(Frame):
 
         # Inner frame for content
         self.inner_frame = Frame(self.canvas, bg=EnhancedSciFiTheme.BG_DARK)
-        self.canvas.create_window(0, 0, window=self.inner_frame, anchor=tk.NW)
+        self.inner_window = self.canvas.create_window(0, 0, window=self.inner_frame,
+                                                      anchor=tk.NW)
 
         # Bind resize
         self.canvas.bind('<Configure>', self._on_resize)
 
+        # (probe item id, time) of the last churn reading
+        self._churn_probe = (self._probe_item_id(), time.perf_counter())
+
     def start_animation(self):
         """Start border animation"""
         self.animating = True
-        self._animate_border()
+        if self.clock is None:
+            self.clock = FrameScheduler.for_widget(self).subscribe(
+                self, self._animate_border, self.animation_speed)
 
     def stop_animation(self):
         """Stop border animation"""
         self.animating = False
+        if self.clock is not None:
+            self.clock.cancel()
+            self.clock = None
+
+    def _probe_item_id(self):
+        """Id the canvas gives its next item; ids are sequential per canvas"""
+        probe = self.canvas.create_line(0, 0, 0, 0)
+        self.canvas.delete(probe)
+        return probe
+
+    def items_created_per_second(self):
+        """Canvas items created per second since the last call (0 once settled)"""
+        probe, now = self._probe_item_id(), time.perf_counter()
+        last_probe, last_time = self._churn_probe
+        self._churn_probe = (probe, now)
+        if now <= last_time:
+            return 0.0
+        return (probe - last_probe - 1) / (now - last_time)
+
+    def _build_border(self):
+        """Create the border rectangle and corner accents once"""
+        thickness = self.BORDER_THICKNESS
+        corner_size = self.CORNER_SIZE
+        color = self._glow_color()
+
+        self.border_rect = self.canvas.create_rectangle(
+            0, 0, self.canvas.winfo_width(), self.canvas.winfo_height(),
+            outline=color, width=thickness, tags='border')
+
+        # Draw corner accents
+        self.canvas.create_line(0, 0, corner_size, 0, fill=color,
+                               width=thickness, tags=('border', 'border_corner'))
+        self.canvas.create_line(0, 0, 0, corner_size, fill=color,
+                               width=thickness, tags=('border', 'border_corner'))
+
+        self.border_color_drawn = color
+
+    def _glow_color(self):
+        """Current glow colour for the animation state"""
+        glow_index = self.animation_state % len(EnhancedSciFiTheme.GLOW_LEVELS)
+        return EnhancedSciFiTheme.GLOW_LEVELS[glow_index]
 
     def _animate_border(self):
         """Animate the border glow"""
         if not self.animating:
             return
 
-        self.canvas.delete('border')
-        w = self.canvas.winfo_width()
-        h = self.canvas.winfo_height()
+        if self.border_rect is None:
+            self._build_border()
 
-        # Calculate glow intensity
-        glow_index = self.animation_state % len(EnhancedSciFiTheme.GLOW_LEVELS)
-        color = EnhancedSciFiTheme.GLOW_LEVELS[glow_index]
-
-        # Draw animated border
-        thickness = 3
-        self.canvas.create_rectangle(0, 0, w, h, outline=color,
-                                     width=thickness, tags='border')
-
-        # Draw corner accents
-        corner_size = 20
-        self.canvas.create_line(0, 0, corner_size, 0, fill=color,
-                               width=thickness, tags='border')
-        self.canvas.create_line(0, 0, 0, corner_size, fill=color,
-                               width=thickness, tags='border')
+        # Only touch the canvas when the glow colour actually changes
+        color = self._glow_color()
+        if color != self.border_color_drawn:
+            self.canvas.itemconfig(self.border_rect, outline=color)
+            self.canvas.itemconfig('border_corner', fill=color)
+            self.border_color_drawn = color
 
         self.animation_state += 1
-        self.after(self.animation_speed, self._animate_border)
 
     def _on_resize(self, event):
         """Handle resize event"""
-        self.canvas.itemconfig(self.inner_frame, width=event.width, height=event.height)
+        self.canvas.itemconfig(self.inner_window, width=event.width, height=event.height)
+
+        if self.border_rect is not None:
+            self.canvas.coords(self.border_rect, 0, 0, event.width, event.height)
 
 # ============================================================================
 # SCANLINE EFFECT CANVAS
@@ -168,54 +792,141 @@ class AnimatedBorderFrame(Frame):
 class ScanlineCanvas(Canvas):
     """Canvas with CRT scanline effect"""
 
-    def __init__(self, parent, scanline_speed=3, **kwargs):
+    def __init__(self, parent, scanline_speed=3, trail_length=4, trail_spacing=10,
+                 trail_fade=0.2, **kwargs):
         super().__init__(parent, **kwargs)
 
         self.scanline_speed = scanline_speed
         self.scanline_pos = 0
         self.scanline_enabled = True
+        self.clock = None
+        self.render_quality = 1.0
 
+        # Trail: `trail_length` lines `trail_spacing` px apart, each one
+        # `trail_fade` closer to the background than the one before it
+        self.trail_length = trail_length
+        self.trail_spacing = trail_spacing
+        self.trail_fade = trail_fade
+
+        # Line items (scanline first) and their current y positions
+        self.scanline_items = []
+        self.scanline_offsets = []
+        self.scanline_ys = []
+        self.drawn_size = None
+
+        self.bind('<Configure>', self._on_resize, add='+')
+
+        FrameRateGovernor.for_widget(self).register(self)
         self.start_scanlines()
 
     def start_scanlines(self):
         """Start scanline animation"""
         self.scanline_enabled = True
-        self._animate_scanlines()
+        if self.clock is None:
+            self.clock = FrameScheduler.for_widget(self).subscribe(
+                self, self._animate_scanlines, 30, decorative=True)
 
     def stop_scanlines(self):
         """Stop scanline animation"""
         self.scanline_enabled = False
+        if self.clock is not None:
+            self.clock.cancel()
+            self.clock = None
+
+    def configure_trail(self, trail_length=None, trail_spacing=None, trail_fade=None):
+        """Change the trail; the items and colour ramp are rebuilt once"""
+        if trail_length is not None:
+            self.trail_length = trail_length
+        if trail_spacing is not None:
+            self.trail_spacing = trail_spacing
+        if trail_fade is not None:
+            self.trail_fade = trail_fade
+
+        self.delete('scanline')
+        self.scanline_items = []
+        self.drawn_size = None
+
+    def set_render_quality(self, quality):
+        """Shorten the trail below full quality and drop it at minimal quality"""
+        if quality != self.render_quality:
+            self.render_quality = quality
+            self.configure_trail()
+
+    def _trail_colors(self):
+        """Fade ramp from GREEN_DIM toward the canvas background"""
+        fg = self.winfo_rgb(EnhancedSciFiTheme.GREEN_DIM)
+        bg = self.winfo_rgb(self.cget('bg') or EnhancedSciFiTheme.BG_BLACK)
+
+        trail_length = (int(self.trail_length * self.render_quality)
+                        if self.render_quality >= 0.5 else 0)
+
+        colors = []
+        for i in range(1, trail_length + 1):
+            brightness = 1.0 - self.trail_fade * i
+            if brightness <= 0:
+                break
+            rgb = [int(b + (f - b) * brightness) >> 8 for f, b in zip(fg, bg)]
+            colors.append("#%02x%02x%02x" % tuple(rgb))
+        return colors
+
+    def _build_scanlines(self, w, h):
+        """Create the scanline and trail items for a w x h canvas"""
+        self.delete('scanline')
+
+        self.scanline_items = [self.create_line(0, 0, w, 0,
+                                                fill=EnhancedSciFiTheme.GREEN_BRIGHT,
+                                                width=2, tags='scanline')]
+        self.scanline_offsets = [0]
+
+        for i, color in enumerate(self._trail_colors(), start=1):
+            self.scanline_items.append(self.create_line(0, 0, w, 0, fill=color,
+                                                        width=1, tags='scanline'))
+            self.scanline_offsets.append(i * self.trail_spacing)
+
+        self.scanline_ys = [0] * len(self.scanline_items)
+        self._place_scanlines(w, h)
+
+    def _place_scanlines(self, w, h):
+        """Put every line at its position for the current scanline_pos"""
+        y = self.scanline_pos % h
+        for i, item in enumerate(self.scanline_items):
+            line_y = (y - self.scanline_offsets[i]) % h
+            self.scanline_ys[i] = line_y
+            self.coords(item, 0, line_y, w, line_y)
+        self.drawn_size = (w, h)
+
+    def _on_resize(self, event):
+        """Stretch the lines to the new size"""
+        if self.scanline_items:
+            self._place_scanlines(event.width, event.height)
 
     def _animate_scanlines(self):
         """Animate CRT scanlines"""
         if not self.scanline_enabled:
             return
 
-        self.delete('scanline')
-
         h = self.winfo_height()
         if h <= 1:
-            self.after(50, self._animate_scanlines)
             return
 
-        # Draw scanline
-        y = self.scanline_pos % h
-        self.create_line(0, y, self.winfo_width(), y,
-                        fill=EnhancedSciFiTheme.GREEN_BRIGHT,
-                        width=2, tags='scanline')
-
-        # Draw fading trail
-        for i in range(1, 5):
-            trail_y = (y - i * 10) % h
-            opacity = 255 - (i * 50)
-            if opacity > 0:
-                trail_color = f"#{opacity:02x}{opacity:02x}{opacity:02x}"
-                self.create_line(0, trail_y, self.winfo_width(), trail_y,
-                               fill=EnhancedSciFiTheme.GREEN_DIM,
-                               width=1, tags='scanline')
-
-        self.scanline_pos += self.scanline_speed
-        self.after(30, self._animate_scanlines)
+        if not self.scanline_items:
+            self._build_scanlines(self.winfo_width(), h)
+        elif self.drawn_size[1] != h:
+            self._place_scanlines(self.winfo_width(), h)
+
+        # Slide every line at once; only lines that wrap are repositioned
+        speed = self.scanline_speed
+        self.move('scanline', 0, speed)
+        self.tag_raise('scanline')
+
+        ys = self.scanline_ys
+        for i in range(len(ys)):
+            ys[i] += speed
+            if ys[i] >= h:
+                ys[i] -= h
+                self.coords(self.scanline_items[i], 0, ys[i], self.drawn_size[0], ys[i])
+
+        self.scanline_pos += speed
 
 # ============================================================================
 # DATA STREAM WIDGET
@@ -224,17 +935,35 @@ class ScanlineCanvas(Canvas):
 class DataStreamWidget(Canvas):
     """Animated data stream display (Matrix-style)"""
 
+    GLYPH_SPACING = 15
+
     def __init__(self, parent, stream_count=10, **kwargs):
         super().__init__(parent, bg=EnhancedSciFiTheme.BG_BLACK,
                         highlightthickness=0, **kwargs)
 
         self.stream_count = stream_count
-        self.streams = []
         self.running = False
+        self.clock = None
+        self.render_quality = 1.0
+
+        # Stream state, one element per stream
+        self.stream_x = np.zeros(0, dtype=np.int32)
+        self.stream_y = np.zeros(0, dtype=np.int32)
+        self.stream_speed = np.zeros(0, dtype=np.int32)
+        self.stream_length = np.zeros(0, dtype=np.int32)
+        self.drawn_y = np.zeros(0, dtype=np.int32)
+
+        # Tags addressing the pooled glyph items
+        self.stream_tags = []
+        self.speed_tags = {}
+        self.slot_tags = []
+        self.slot_chars = []
+        self.stream_shown = np.zeros(0, dtype=bool)
 
         # Character pool for data stream
         self.chars = "01アイウエオカキクケコサシスセソタチツテトナニヌネノ"
 
+        FrameRateGovernor.for_widget(self).register(self)
         self.start_stream()
 
     def start_stream(self):
@@ -244,81 +973,171 @@ class DataStreamWidget(Canvas):
         self.after(100, self._initialize_streams)
 
     def _initialize_streams(self):
-        """Initialize stream positions after widget is sized"""
+        """Initialize stream positions and glyph pool after widget is sized"""
         # Initialize streams with proper width
         w = self.winfo_width()
         if w <= 1:
             w = 400  # Default width
 
         # Clear any existing streams
-        self.streams = []
+        self.delete('stream')
 
         # Calculate stream spacing to center them
         stream_spacing = w / (self.stream_count + 1)
 
-        for i in range(self.stream_count):
-            x = int(stream_spacing * (i + 1))
-            self.streams.append({
-                'x': x,
-                'y': -50 - (i * 30),  # Stagger initial positions
-                'speed': 2 + (i % 3),
-                'length': 10 + (i % 10),
-                'chars': []
-            })
-
-        self._animate_stream()
+        index = np.arange(self.stream_count, dtype=np.int32)
+        self.stream_x = (stream_spacing * (index + 1)).astype(np.int32)
+        self.stream_y = -50 - (index * 30)  # Stagger initial positions
+        self.stream_speed = 2 + (index % 3)
+        self.stream_length = 10 + (index % 10)
+        self.drawn_y = self.stream_y.copy()
+
+        # Fixed pool of glyph items: each stream is moved as a unit, each
+        # slot (position within a stream) shares a character and colour
+        max_length = int(self.stream_length.max()) if self.stream_count else 0
+        self.stream_tags = [f'stream{k}' for k in range(self.stream_count)]
+        self.speed_tags = {int(speed): f'speed{speed}' for speed in np.unique(self.stream_speed)}
+        self.slot_tags = [f'slot{i}' for i in range(max_length)]
+        self.slot_chars = [None] * max_length
+
+        for k in range(self.stream_count):
+            x = int(self.stream_x[k])
+            head_y = int(self.stream_y[k])
+            speed_tag = self.speed_tags[int(self.stream_speed[k])]
+
+            for i in range(int(self.stream_length[k])):
+                # Calculate color (fade from bright to dark)
+                if i == 0:
+                    color = EnhancedSciFiTheme.GREEN_BRIGHT
+                elif i < 3:
+                    color = EnhancedSciFiTheme.GREEN_MEDIUM
+                else:
+                    color = EnhancedSciFiTheme.GREEN_DIM
+
+                self.create_text(x, head_y - (i * self.GLYPH_SPACING), text="",
+                               fill=color, font=EnhancedSciFiTheme.FONT_MONO,
+                               tags=('stream', self.stream_tags[k], speed_tag,
+                                     self.slot_tags[i]))
+
+        self.stream_shown = np.ones(self.stream_count, dtype=bool)
+        self._apply_render_quality()
+
+        if self.running and self.clock is None:
+            self.clock = FrameScheduler.for_widget(self).subscribe(
+                self, self._animate_stream, 50, decorative=True)
+
+    def set_render_quality(self, quality):
+        """Show every stream at full quality, every 2nd or 4th one below it"""
+        self.render_quality = quality
+        self._apply_render_quality()
+
+    def _apply_render_quality(self):
+        """Hide the streams the current quality leaves out"""
+        step = max(1, int(round(1.0 / self.render_quality)))
+        shown = np.arange(len(self.stream_shown)) % step == 0
+        for k in np.flatnonzero(shown != self.stream_shown):
+            self.itemconfigure(self.stream_tags[k], state='normal' if shown[k] else 'hidden')
+        self.stream_shown = shown
 
     def stop_stream(self):
         """Stop data stream"""
         self.running = False
+        if self.clock is not None:
+            self.clock.cancel()
+            self.clock = None
 
     def _animate_stream(self):
         """Animate the data streams"""
         if not self.running:
             return
 
-        self.delete('stream')
-
         h = self.winfo_height() or 300
 
-        for stream in self.streams:
-            # Update position
-            stream['y'] += stream['speed']
-
-            # Reset if off screen
-            if stream['y'] > h + 100:
-                stream['y'] = -50
+        # Advance every stream in one step and wrap the ones off screen
+        self.stream_y += self.stream_speed
+        wrapped = self.stream_y > h + 100
+        self.stream_y[wrapped] = -50
 
-            # Draw stream
-            for i in range(stream['length']):
-                y = stream['y'] - (i * 15)
-                if 0 <= y <= h:
-                    # Calculate color (fade from bright to dark)
-                    if i == 0:
-                        color = EnhancedSciFiTheme.GREEN_BRIGHT
-                    elif i < 3:
-                        color = EnhancedSciFiTheme.GREEN_MEDIUM
-                    else:
-                        color = EnhancedSciFiTheme.GREEN_DIM
+        # Move each speed group with one call, then correct wrapped streams
+        for speed, tag in self.speed_tags.items():
+            self.move(tag, 0, speed)
+        self.drawn_y += self.stream_speed
 
-                    # Random character
-                    char = self.chars[int(time.time() * 1000 + i) % len(self.chars)]
+        for k in np.flatnonzero(wrapped):
+            self.move(self.stream_tags[k], 0, int(self.stream_y[k] - self.drawn_y[k]))
+        self.drawn_y[:] = self.stream_y
 
-                    self.create_text(stream['x'], y, text=char,
-                                   fill=color, font=EnhancedSciFiTheme.FONT_MONO,
-                                   tags='stream')
-
-        self.after(50, self._animate_stream)
+        # Random character per slot, shared by every stream
+        now_ms = int(time.time() * 1000)
+        for i, tag in enumerate(self.slot_tags):
+            char = self.chars[(now_ms + i) % len(self.chars)]
+            if char != self.slot_chars[i]:
+                self.itemconfig(tag, text=char)
+                self.slot_chars[i] = char
 
 # ============================================================================
 # GLOWING BUTTON
 # ============================================================================
 
+class SharedGlowPhase:
+    """One glow clock for every GlowButton created with shared_glow=True"""
+
+    INTERVAL_MS = 150
+
+    def __init__(self, scheduler: FrameScheduler):
+        self.scheduler = scheduler
+        self.phase = 0
+        self.buttons = []
+        self.clock = None
+
+    @classmethod
+    def for_widget(cls, widget) -> 'SharedGlowPhase':
+        """Return the shared phase for a widget's Tk root"""
+        root = widget._root()
+        phase = getattr(root, '_shared_glow_phase', None)
+        if phase is None:
+            phase = cls(FrameScheduler.for_widget(root))
+            root._shared_glow_phase = phase
+        return phase
+
+    def add(self, button):
+        """Drive `button` from the shared phase"""
+        self.buttons.append(button)
+        self.scheduler.watch(button)
+        button.bind('<Destroy>',
+                    lambda event, b=button: self.remove(b) if event.widget is b else None,
+                    add='+')
+
+        if self.clock is None:
+            self.clock = self.scheduler.subscribe(self.scheduler.root, self._advance,
+                                                  self.INTERVAL_MS)
+
+    def remove(self, button):
+        """Stop driving `button`"""
+        if button in self.buttons:
+            self.buttons.remove(button)
+
+        if not self.buttons and self.clock is not None:
+            self.clock.cancel()
+            self.clock = None
+
+    def _advance(self):
+        """Step the glow and recolour every idle, visible button"""
+        self.phase += 1
+        for button in self.buttons:
+            if button.is_pressed or not self.scheduler.is_visible(button):
+                continue
+            button.glow_state = self.phase
+            button.draw_button()
+
+
 class GlowButton(Canvas):
     """Button with glowing effect"""
 
+    CORNER_SIZE = 8
+
     def __init__(self, parent, text="BUTTON", command=None,
-                 width=150, height=40, **kwargs):
+                 width=150, height=40, shared_glow=False, **kwargs):
         super().__init__(parent, width=width, height=height,
                         bg=EnhancedSciFiTheme.BG_DARK,
                         highlightthickness=0, **kwargs)
@@ -328,7 +1147,11 @@ class GlowButton(Canvas):
         self.glow_state = 0
         self.is_pressed = False
         self.is_hovered = False
+        self.clock = None
 
+        # Items are created once; state changes only recolour them
+        self.drawn_colors = (None, None, None)  # (bg, text, border)
+        self._create_items(width, height)
         self.draw_button()
 
         # Bind events
@@ -336,49 +1159,74 @@ class GlowButton(Canvas):
         self.bind('<ButtonRelease-1>', self._on_release)
         self.bind('<Enter>', self._on_enter)
         self.bind('<Leave>', self._on_leave)
+        self.bind('<Configure>', self._on_resize)
 
         # Start glow animation
-        self._animate_glow()
-
-    def draw_button(self):
-        """Draw the button"""
-        self.delete('all')
-
-        w = self.winfo_width() or 150
-        h = self.winfo_height() or 40
-
-        # Determine colors based on state
-        if self.is_pressed:
-            bg_color = EnhancedSciFiTheme.GREEN_BRIGHT
-            text_color = EnhancedSciFiTheme.BG_BLACK
-            border_color = EnhancedSciFiTheme.GREEN_BRIGHT
-        elif self.is_hovered:
-            bg_color = EnhancedSciFiTheme.BG_LIGHT
-            text_color = EnhancedSciFiTheme.GREEN_BRIGHT
-            border_color = EnhancedSciFiTheme.GREEN_BRIGHT
+        if shared_glow:
+            SharedGlowPhase.for_widget(self).add(self)
         else:
-            bg_color = EnhancedSciFiTheme.BG_MEDIUM
-            text_color = EnhancedSciFiTheme.GREEN_GLOW
-            # Use glow animation
-            glow_index = self.glow_state % len(EnhancedSciFiTheme.GLOW_LEVELS)
-            border_color = EnhancedSciFiTheme.GLOW_LEVELS[glow_index]
+            self.clock = FrameScheduler.for_widget(self).subscribe(
+                self, self._animate_glow, 150)
+
+    def _create_items(self, w, h):
+        """Create the background, corner decorations and text"""
+        self.bg_item = self.create_rectangle(0, 0, 0, 0, width=2, tags='bg')
+
+        # Corner decorations
+        self.corner_items = [self.create_line(0, 0, 0, 0, width=3, tags='corner')
+                             for _ in range(4)]
+
+        self.text_item = self.create_text(0, 0, text=self.text,
+                                          font=EnhancedSciFiTheme.FONT_MONO_BOLD,
+                                          tags='text')
+        self._layout(w, h)
+
+    def _layout(self, w, h):
+        """Position the button items for a w x h canvas"""
+        corner_size = self.CORNER_SIZE
+        top_left_h, top_left_v, top_right_h, top_right_v = self.corner_items
+
+        self.coords(self.bg_item, 2, 2, w-2, h-2)
+        self.coords(top_left_h, 2, 2, corner_size, 2)
+        self.coords(top_left_v, 2, 2, 2, corner_size)
+        self.coords(top_right_h, w-2, 2, w-corner_size, 2)
+        self.coords(top_right_v, w-2, 2, w-2, corner_size)
+        self.coords(self.text_item, w//2, h//2)
+
+    def _state_colors(self):
+        """(bg, text, border) colours for the current state"""
+        if self.is_pressed:
+            return (EnhancedSciFiTheme.GREEN_BRIGHT, EnhancedSciFiTheme.BG_BLACK,
+                    EnhancedSciFiTheme.GREEN_BRIGHT)
+        if self.is_hovered:
+            return (EnhancedSciFiTheme.BG_LIGHT, EnhancedSciFiTheme.GREEN_BRIGHT,
+                    EnhancedSciFiTheme.GREEN_BRIGHT)
+
+        # Use glow animation
+        glow_index = self.glow_state % len(EnhancedSciFiTheme.GLOW_LEVELS)
+        return (EnhancedSciFiTheme.BG_MEDIUM, EnhancedSciFiTheme.GREEN_GLOW,
+                EnhancedSciFiTheme.GLOW_LEVELS[glow_index])
+
+    @instrumented
+    def draw_button(self):
+        """Apply the current state, touching only the colours that changed"""
+        bg_color, text_color, border_color = self._state_colors()
+        drawn_bg, drawn_text, drawn_border = self.drawn_colors
 
-        # Draw background
-        self.create_rectangle(2, 2, w-2, h-2, fill=bg_color,
-                            outline=border_color, width=2, tags='bg')
+        if bg_color != drawn_bg and border_color != drawn_border:
+            self.itemconfig(self.bg_item, fill=bg_color, outline=border_color)
+        elif bg_color != drawn_bg:
+            self.itemconfig(self.bg_item, fill=bg_color)
+        elif border_color != drawn_border:
+            self.itemconfig(self.bg_item, outline=border_color)
 
-        # Draw corner decorations
-        corner_size = 8
-        self.create_line(2, 2, corner_size, 2, fill=border_color, width=3)
-        self.create_line(2, 2, 2, corner_size, fill=border_color, width=3)
+        if border_color != drawn_border:
+            self.itemconfig('corner', fill=border_color)
 
-        self.create_line(w-2, 2, w-corner_size, 2, fill=border_color, width=3)
-        self.create_line(w-2, 2, w-2, corner_size, fill=border_color, width=3)
+        if text_color != drawn_text:
+            self.itemconfig(self.text_item, fill=text_color)
 
-        # Draw text
-        self.create_text(w//2, h//2, text=self.text,
-                        fill=text_color, font=EnhancedSciFiTheme.FONT_MONO_BOLD,
-                        tags='text')
+        self.drawn_colors = (bg_color, text_color, border_color)
 
     def _animate_glow(self):
         """Animate button glow"""
@@ -386,7 +1234,9 @@ class GlowButton(Canvas):
             self.glow_state += 1
             self.draw_button()
 
-        self.after(150, self._animate_glow)
+    def _on_resize(self, event):
+        """Handle resize event"""
+        self._layout(event.width, event.height)
 
     def _on_press(self, event):
         """Handle button press"""
@@ -416,9 +1266,27 @@ class GlowButton(Canvas):
 # HEX DISPLAY PANEL
 # ============================================================================
 
+def synthetic_hex_rows(hex_table, width):
+    """Pre-format every row of the synthetic dump pattern"""
+    return tuple(''.join(hex_table[((base + i) * 37) % 256] for i in range(width))
+                 for base in range(0, 256, width))
+
 class HexDisplayPanel(Frame):
     """Hexadecimal data display panel"""
 
+    LINE_HEIGHT = 15
+    BYTES_PER_ROW = 16
+    ROW_CACHE_SIZE = 1024
+
+    # Byte -> "XX " for the hex column
+    HEX_TABLE = tuple(f"{b:02X} " for b in range(256))
+
+    # Byte -> character for the ASCII column of real data
+    ASCII_TABLE = bytes(b if 32 <= b < 127 else ord('.') for b in range(256))
+
+    # The synthetic pattern only depends on the row offset modulo 256
+    SYNTHETIC_ROWS = synthetic_hex_rows(HEX_TABLE, BYTES_PER_ROW)
+
     def __init__(self, parent, width=400, height=200, **kwargs):
         super().__init__(parent, bg=EnhancedSciFiTheme.BG_BLACK, **kwargs)
 
@@ -426,58 +1294,228 @@ class HexDisplayPanel(Frame):
                             highlightthickness=0, width=width, height=height)
         self.canvas.pack(fill=tk.BOTH, expand=True)
 
-        self.data_offset = 0
+        self.data_offset = 0  # Scroll position in pixels
         self.scrolling = True
+        self.clock = None
+
+        # Reused text items: row r is always shown by item r % len(row_items)
+        self.row_items = []
+        self.item_rows = []
+        self.drawn_offset = None
+        self.row_cache = OrderedDict()  # row offset -> formatted text (LRU)
+
+        # Real-data mode (see open_file)
+        self.source_path = None
+        self.source_file = None
+        self.source_map = None
+        self.source_view = None
+
+        # Navigation
+        self.canvas.bind('<Configure>', self._on_resize)
+        self.canvas.bind('<Button-1>', lambda event: self.canvas.focus_set())
+        self.canvas.bind('<MouseWheel>', self._on_mousewheel)
+        self.canvas.bind('<Button-4>', lambda event: self.scroll(-3))
+        self.canvas.bind('<Button-5>', lambda event: self.scroll(3))
+        self.canvas.bind('<Up>', lambda event: self.scroll(-1))
+        self.canvas.bind('<Down>', lambda event: self.scroll(1))
+        self.canvas.bind('<Prior>', lambda event: self.scroll(-self._page_rows()))
+        self.canvas.bind('<Next>', lambda event: self.scroll(self._page_rows()))
+        self.canvas.bind('<Home>', lambda event: self.jump_to_offset(0))
+        self.canvas.bind('<End>', lambda event: self.jump_to_offset(self.source_size()))
 
         self.start_scroll()
 
     def start_scroll(self):
         """Start scrolling hex data"""
         self.scrolling = True
-        self._animate_hex()
+        if self.clock is None:
+            self.clock = FrameScheduler.for_widget(self).subscribe(
+                self, self._animate_hex, 50, decorative=True)
 
     def stop_scroll(self):
         """Stop scrolling"""
         self.scrolling = False
+        if self.clock is not None:
+            self.clock.cancel()
+            self.clock = None
+
+    def open_file(self, path):
+        """Display a file through a read-only memory map (stops auto-scrolling)"""
+        self.close_file()
+        self.stop_scroll()
+
+        source_file = open(path, 'rb')
+        try:
+            size = os.fstat(source_file.fileno()).st_size
+            # mmap cannot map an empty file
+            source_map = (mmap.mmap(source_file.fileno(), 0, access=mmap.ACCESS_READ)
+                          if size else None)
+        except (OSError, ValueError):
+            source_file.close()
+            raise
+
+        self.source_path = path
+        self.source_file = source_file
+        self.source_map = source_map
+        self.source_view = memoryview(source_map) if source_map is not None else memoryview(b'')
+        self.data_offset = 0
+        self._reset_rows()
+        self._draw_rows()
+
+    def close_file(self):
+        """Release the memory map and return to synthetic data"""
+        if self.source_view is not None:
+            self.source_view.release()
+        if self.source_map is not None:
+            self.source_map.close()
+        if self.source_file is not None:
+            self.source_file.close()
+
+        self.source_path = None
+        self.source_file = None
+        self.source_map = None
+        self.source_view = None
+        self.data_offset = 0
+        self._reset_rows()
+
+    def source_size(self):
+        """Size in bytes of the open file (0 in synthetic mode)"""
+        return len(self.source_view) if self.source_view is not None else 0
+
+    def scroll(self, rows):
+        """Scroll by a number of rows (negative scrolls up)"""
+        self.data_offset = self._clamp_offset(self.data_offset + rows * self.LINE_HEIGHT)
+        self._draw_rows()
+
+    def jump_to_offset(self, offset):
+        """Bring the row containing byte `offset` to the top of the panel"""
+        row = max(0, offset) // self.BYTES_PER_ROW
+        self.data_offset = self._clamp_offset(row * self.LINE_HEIGHT)
+        self._draw_rows()
+
+    def destroy(self):
+        """Release the memory map with the widget"""
+        self.close_file()
+        super().destroy()
+
+    def _clamp_offset(self, data_offset):
+        """Keep the scroll position inside the open file"""
+        data_offset = max(0, data_offset)
+        if self.source_view is None:
+            return data_offset
+
+        total_rows = -(-self.source_size() // self.BYTES_PER_ROW)
+        last_top_row = max(0, total_rows - self._page_rows())
+        return min(data_offset, last_top_row * self.LINE_HEIGHT)
+
+    def _canvas_height(self):
+        """Canvas height, falling back to the requested height before mapping"""
+        h = self.canvas.winfo_height()
+        return h if h > 1 else int(self.canvas.cget('height'))
+
+    def _page_rows(self):
+        """Number of fully visible rows"""
+        return max(1, self._canvas_height() // self.LINE_HEIGHT)
+
+    def _on_resize(self, event):
+        """Redraw real data for the new height"""
+        if self.source_view is not None:
+            self.data_offset = self._clamp_offset(self.data_offset)
+            self._draw_rows()
+
+    def _on_mousewheel(self, event):
+        """Scroll three rows per wheel notch"""
+        self.scroll(-3 if event.delta > 0 else 3)
 
     def _generate_hex_line(self, offset):
         """Generate a line of hex data"""
-        hex_data = f"{offset:08X}  "
+        row_index = (offset % 256) // self.BYTES_PER_ROW
+        return f"{offset:08X}  {self.SYNTHETIC_ROWS[row_index]}"
+
+    def _format_row(self, offset, chunk):
+        """Format a row of real data: offset, hex bytes and ASCII"""
+        hex_bytes = ''.join(map(self.HEX_TABLE.__getitem__, chunk))
+        hex_bytes = hex_bytes.ljust(self.BYTES_PER_ROW * 3)
+        ascii_text = bytes(chunk).translate(self.ASCII_TABLE).decode('ascii')
+        return f"{offset:08X}  {hex_bytes} {ascii_text}"
+
+    def _row_text(self, row):
+        """Text for a row, or None past the end of the open file"""
+        offset = row * self.BYTES_PER_ROW
+
+        text = self.row_cache.get(offset)
+        if text is not None:
+            self.row_cache.move_to_end(offset)
+            return text
+
+        if self.source_view is None:
+            text = self._generate_hex_line(offset)
+        elif offset >= len(self.source_view):
+            return None
+        else:
+            with self.source_view[offset:offset + self.BYTES_PER_ROW] as chunk:
+                text = self._format_row(offset, chunk)
+
+        self.row_cache[offset] = text
+        if len(self.row_cache) > self.ROW_CACHE_SIZE:
+            self.row_cache.popitem(last=False)
+        return text
+
+    def _reset_rows(self):
+        """Drop the text item pool and cached rows (data source changed)"""
+        self.canvas.delete('hex')
+        self.row_items = []
+        self.item_rows = []
+        self.drawn_offset = None
+        self.row_cache.clear()
+
+    @instrumented
+    def _draw_rows(self):
+        """Draw the rows currently on screen, updating only rows that changed"""
+        line_height = self.LINE_HEIGHT
+        num_lines = self._canvas_height() // line_height + 2
+
+        if len(self.row_items) != num_lines:
+            self.canvas.delete('hex')
+            self.row_items = [self.canvas.create_text(5, 0, text="", anchor=tk.NW,
+                                                      font=EnhancedSciFiTheme.FONT_MONO_SMALL,
+                                                      tags='hex')
+                              for _ in range(num_lines)]
+            self.item_rows = [None] * num_lines
+            self.drawn_offset = None
+
+        # Rows already on screen just slide with the scroll position
+        if self.drawn_offset is not None and self.data_offset != self.drawn_offset:
+            self.canvas.move('hex', 0, self.drawn_offset - self.data_offset)
+        self.drawn_offset = self.data_offset
+
+        first_row = self.data_offset // line_height
+        for row in range(first_row, first_row + num_lines):
+            slot = row % num_lines
+            if self.item_rows[slot] == row:
+                continue
+
+            item = self.row_items[slot]
+            self.item_rows[slot] = row
+
+            hex_line = self._row_text(row)
+            if hex_line is None:
+                self.canvas.itemconfig(item, state=tk.HIDDEN)
+                continue
 
-        # Generate 16 bytes of "data"
-        for i in range(16):
-            hex_data += f"{((offset + i) * 37) % 256:02X} "
+            # Alternate colors for readability
+            color = EnhancedSciFiTheme.GREEN_GLOW if row % 2 == 0 else EnhancedSciFiTheme.GREEN_MEDIUM
 
-        return hex_data
+            self.canvas.coords(item, 5, row * line_height - self.data_offset)
+            self.canvas.itemconfig(item, text=hex_line, fill=color, state=tk.NORMAL)
 
     def _animate_hex(self):
         """Animate scrolling hex dump"""
         if not self.scrolling:
             return
 
-        self.canvas.delete('hex')
-
-        h = self.canvas.winfo_height() or 200
-        line_height = 15
-        num_lines = h // line_height + 2
-
-        y_offset = -(self.data_offset % line_height)
-
-        for i in range(num_lines):
-            y = y_offset + (i * line_height)
-            offset = ((self.data_offset // line_height) + i) * 16
-
-            hex_line = self._generate_hex_line(offset)
-
-            # Alternate colors for readability
-            color = EnhancedSciFiTheme.GREEN_GLOW if i % 2 == 0 else EnhancedSciFiTheme.GREEN_MEDIUM
-
-            self.canvas.create_text(5, y, text=hex_line, anchor=tk.NW,
-                                  fill=color, font=EnhancedSciFiTheme.FONT_MONO_SMALL,
-                                  tags='hex')
-
-        self.data_offset += 1
-        self.after(50, self._animate_hex)
+        self._draw_rows()
+        self.data_offset = self._clamp_offset(self.data_offset + 1)
 
 # ============================================================================
 # CIRCULAR GAUGE WIDGET
@@ -486,6 +1524,9 @@ class HexDisplayPanel(Frame):
 class CircularGauge(Canvas):
     """Circular gauge for displaying metrics"""
 
+    # Tick mark geometry per gauge size, shared by every gauge of that size
+    _tick_geometry = {}
+
     def __init__(self, parent, label="METRIC", min_val=0, max_val=100,
                  size=150, **kwargs):
         super().__init__(parent, width=size, height=size,
@@ -498,16 +1539,45 @@ class CircularGauge(Canvas):
         self.current_val = 0
         self.target_val = 0
         self.size = size
+        self.clock = None
+
+        # Value layer items and what they currently show
+        self.arc_item = None
+        self.value_item = None
+        self.drawn_value = None  # (arc extent, text, colour)
 
         self.draw_gauge()
-        self._animate_value()
+
+    @classmethod
+    def tick_geometry(cls, size):
+        """Tick mark line coordinates for a gauge of the given size"""
+        ticks = cls._tick_geometry.get(size)
+        if ticks is None:
+            cx = cy = size // 2
+            radius = size // 2 - 20
+            ticks = []
+            for i in range(0, 280, 30):
+                angle = math.radians(135 + i)
+                ticks.append((cx + (radius - 5) * math.cos(angle),
+                              cy + (radius - 5) * math.sin(angle),
+                              cx + radius * math.cos(angle),
+                              cy + radius * math.sin(angle)))
+            ticks = tuple(ticks)
+            cls._tick_geometry[size] = ticks
+        return ticks
 
     def set_value(self, value):
         """Set gauge value with smooth animation"""
         self.target_val = max(self.min_val, min(self.max_val, value))
 
+        # Wake the animation only while there is something to animate
+        if abs(self.current_val - self.target_val) > 0.1 and self.clock is None:
+            self.clock = FrameScheduler.for_widget(self).subscribe(
+                self, self._animate_value, 50)
+
+    @instrumented
     def draw_gauge(self):
-        """Draw the gauge"""
+        """Draw the static dial once and create the value layer on top of it"""
         self.delete('all')
 
         cx = self.size // 2
@@ -518,15 +1588,44 @@ class CircularGauge(Canvas):
         self.create_oval(cx - radius, cy - radius,
                         cx + radius, cy + radius,
                         outline=EnhancedSciFiTheme.GREEN_DIM,
-                        width=2)
+                        width=2, tags='dial')
 
         # Draw inner circle
         inner_radius = radius - 10
         self.create_oval(cx - inner_radius, cy - inner_radius,
                         cx + inner_radius, cy + inner_radius,
                         outline=EnhancedSciFiTheme.GREEN_DARK,
-                        width=1)
+                        width=1, tags='dial')
+
+        # Value arc sits between the circles and the tick marks
+        self.arc_item = self.create_arc(cx - radius, cy - radius,
+                                        cx + radius, cy + radius,
+                                        start=135, extent=0, width=4,
+                                        style=tk.ARC, state=tk.HIDDEN,
+                                        tags='value')
+
+        # Draw tick marks
+        for x1, y1, x2, y2 in self.tick_geometry(self.size):
+            self.create_line(x1, y1, x2, y2,
+                           fill=EnhancedSciFiTheme.GREEN_MEDIUM, width=2,
+                           tags='dial')
+
+        # Draw value text
+        self.value_item = self.create_text(cx, cy - 10, text="",
+                                           font=EnhancedSciFiTheme.FONT_MONO_LARGE,
+                                           tags='value')
+
+        # Draw label
+        self.create_text(cx, cy + 15, text=self.label,
+                        fill=EnhancedSciFiTheme.GREEN_MEDIUM,
+                        font=EnhancedSciFiTheme.FONT_MONO_SMALL,
+                        tags='dial')
+
+        self.drawn_value = None
+        self._update_value_layer()
 
+    def _update_value_layer(self):
+        """Update the value arc and text in place"""
         # Calculate arc for current value
         percentage = (self.current_val - self.min_val) / (self.max_val - self.min_val)
         arc_extent = percentage * 270  # 270 degrees max
@@ -539,32 +1638,20 @@ class CircularGauge(Canvas):
         else:
             color = EnhancedSciFiTheme.STATUS_CRITICAL
 
-        # Draw value arc
-        if arc_extent > 0:
-            self.create_arc(cx - radius, cy - radius,
-                          cx + radius, cy + radius,
-                          start=135, extent=arc_extent,
-                          outline=color, width=4, style=tk.ARC)
+        text = f"{self.current_val:.1f}"
+        drawn_extent, drawn_text, drawn_color = self.drawn_value or (None, None, None)
 
-        # Draw tick marks
-        for i in range(0, 280, 30):
-            angle = math.radians(135 + i)
-            x1 = cx + (radius - 5) * math.cos(angle)
-            y1 = cy + (radius - 5) * math.sin(angle)
-            x2 = cx + radius * math.cos(angle)
-            y2 = cy + radius * math.sin(angle)
-
-            self.create_line(x1, y1, x2, y2,
-                           fill=EnhancedSciFiTheme.GREEN_MEDIUM, width=2)
+        if arc_extent != drawn_extent or color != drawn_color:
+            if arc_extent > 0:
+                self.itemconfig(self.arc_item, extent=arc_extent, outline=color,
+                                state=tk.NORMAL)
+            else:
+                self.itemconfig(self.arc_item, state=tk.HIDDEN)
 
-        # Draw value text
-        self.create_text(cx, cy - 10, text=f"{self.current_val:.1f}",
-                        fill=color, font=EnhancedSciFiTheme.FONT_MONO_LARGE)
+        if text != drawn_text or color != drawn_color:
+            self.itemconfig(self.value_item, text=text, fill=color)
 
-        # Draw label
-        self.create_text(cx, cy + 15, text=self.label,
-                        fill=EnhancedSciFiTheme.GREEN_MEDIUM,
-                        font=EnhancedSciFiTheme.FONT_MONO_SMALL)
+        self.drawn_value = (arc_extent, text, color)
 
     def _animate_value(self):
         """Animate value change"""
@@ -572,15 +1659,23 @@ class CircularGauge(Canvas):
         if abs(self.current_val - self.target_val) > 0.1:
             diff = self.target_val - self.current_val
             self.current_val += diff * 0.1
-            self.draw_gauge()
+        else:
+            # Settled: show the exact target and let the clock sleep
+            self.current_val = self.target_val
+            self.clock.cancel()
+            self.clock = None
 
-        self.after(50, self._animate_value)
+        self._update_value_layer()
 
 # Save indicator that part 1 is complete
 if __name__ == "__main__":
     print("ARCHITECT v3.0 Enhanced GUI - Part 1: Theme and Animated Widgets")
     print("Components created:")
     print("  ✓ EnhancedSciFiTheme")
+    print("  ✓ FrameScheduler")
+    print("  ✓ LatestWinsMailbox")
+    print("  ✓ FrameRateGovernor")
+    print("  ✓ PerformanceMonitor")
     print("  ✓ AnimatedBorderFrame")
     print("  ✓ ScanlineCanvas")
     print("  ✓ DataStreamWidget")
@@ -8,15 +8,117 @@ Neural Network Graphs, Threat Maps, Network Topology
 import tkinter as tk
 from tkinter import Canvas, Frame, Label, Scrollbar
 import math
+import time
 import random
-from typing import List, Dict, Tuple, Optional
+import socket
+import threading
+import ipaddress
+import numpy as np
+from typing import List, Dict, Tuple, Optional, Sequence, Union
 from collections import deque
 from datetime import datetime
 
 # Import Part 1 components
 import sys
 sys.path.insert(0, '/home/cdavenport795/ARCHITECT SYSTEM')
-from ARCHITECT_SA_v3_0_ENHANCED_GUI_PART1 import EnhancedSciFiTheme
+from ARCHITECT_SA_v3_0_ENHANCED_GUI_PART1 import (EnhancedSciFiTheme, FrameScheduler, FrameRateGovernor,
+                                                  LatestWinsMailbox, instrumented)
+
+# ============================================================================
+# RASTER HELPERS
+# ============================================================================
+
+def hex_to_rgb(color: str) -> np.ndarray:
+    """'#rrggbb' as a float RGB triple"""
+    return np.array([int(color[i:i + 2], 16) for i in (1, 3, 5)], dtype=float)
+
+
+def color_ramp(stops: Sequence[str], size: int = 256) -> np.ndarray:
+    """(size, 3) uint8 lookup table blending evenly through the given colours"""
+    stops = np.array([hex_to_rgb(color) for color in stops])
+    positions = np.linspace(0, len(stops) - 1, size)
+    return np.stack([np.interp(positions, np.arange(len(stops)), stops[:, channel])
+                     for channel in range(3)], axis=1).astype(np.uint8)
+
+
+def rgb_array_to_ppm(rgb: np.ndarray) -> bytes:
+    """Encode an (h, w, 3) uint8 array as binary PPM for PhotoImage(data=...)"""
+    height, width, _ = rgb.shape
+    return b'P6 %d %d 255\n' % (width, height) + np.ascontiguousarray(rgb, dtype=np.uint8).tobytes()
+
+# ============================================================================
+# ZOOM AND PAN
+# ============================================================================
+
+class ZoomPanView:
+    """Canvas mixin: wheel zoom, drag pan and resize over a widget-sized world
+
+    Call init_view() once, redraw when `view_dirty` is set, override on_view_resized().
+    """
+
+    MAX_ZOOM = 32.0
+
+    def init_view(self):
+        """Reset the view transform and bind the zoom, pan and resize events"""
+        self.zoom = 1.0
+        self.view_x = 0.0
+        self.view_y = 0.0
+        self.view_dirty = True
+        self._drag_start = None
+
+        self.bind('<Configure>', self._on_resize, add='+')
+        self.bind('<MouseWheel>', lambda event: self.zoom_at(event.x, event.y,
+                                                             1.25 if event.delta > 0 else 0.8))
+        self.bind('<Button-4>', lambda event: self.zoom_at(event.x, event.y, 1.25))
+        self.bind('<Button-5>', lambda event: self.zoom_at(event.x, event.y, 0.8))
+        self.bind('<ButtonPress-1>', self._on_drag_start)
+        self.bind('<B1-Motion>', self._on_drag)
+        self.bind('<Double-Button-1>', lambda event: self.reset_view())
+
+    def zoom_at(self, x, y, factor):
+        """Zoom by `factor` keeping the world point under (x, y) in place"""
+        zoom = min(self.MAX_ZOOM, max(1.0, self.zoom * factor))
+        world_x = self.view_x + x / self.zoom
+        world_y = self.view_y + y / self.zoom
+        self.zoom = zoom
+        self._set_view_origin(world_x - x / zoom, world_y - y / zoom)
+
+    def reset_view(self):
+        """Show the whole world"""
+        self.zoom = 1.0
+        self._set_view_origin(0.0, 0.0)
+
+    def _set_view_origin(self, view_x, view_y):
+        """Move the view, keeping it inside the map"""
+        self.view_x = min(max(0.0, view_x), self.width - self.width / self.zoom)
+        self.view_y = min(max(0.0, view_y), self.height - self.height / self.zoom)
+        self.view_dirty = True
+
+    def _on_drag_start(self, event):
+        self._drag_start = (event.x, event.y, self.view_x, self.view_y)
+
+    def _on_drag(self, event):
+        """Pan with the left button"""
+        if self._drag_start is None:
+            return
+        x0, y0, view_x, view_y = self._drag_start
+        self._set_view_origin(view_x - (event.x - x0) / self.zoom,
+                              view_y - (event.y - y0) / self.zoom)
+
+    def _to_screen(self, x, y):
+        """World to screen coordinates (scalars or arrays)"""
+        return (x - self.view_x) * self.zoom, (y - self.view_y) * self.zoom
+
+    def _on_resize(self, event):
+        """Follow the widget size, keeping the view inside it"""
+        if (event.width, event.height) == (self.width, self.height):
+            return
+        self.width, self.height = event.width, event.height
+        self.on_view_resized()
+        self._set_view_origin(self.view_x, self.view_y)
+
+    def on_view_resized(self):
+        """Hook for widgets that keep size-dependent state"""
 
 # ============================================================================
 # NEURAL NETWORK VISUALIZATION
@@ -25,21 +127,119 @@ from ARCHITECT_SA_v3_0_ENHANCED_GUI_PART1 import EnhancedSciFiTheme
 class NeuralNetworkVisualization(Canvas):
     """Visual representation of neural network architecture"""
 
-    def __init__(self, parent, layers=[20, 64, 32, 8], width=600, height=400, **kwargs):
+    # Activation thresholds and (fill, width) per connection bucket
+    CONNECTION_THRESHOLDS = np.array([0.4, 0.7])
+    CONNECTION_STYLES = (
+        (EnhancedSciFiTheme.GREEN_DARK, 1),
+        (EnhancedSciFiTheme.GREEN_MEDIUM, 1),
+        (EnhancedSciFiTheme.GREEN_BRIGHT, 2),
+    )
+
+    # Activation thresholds and (fill, outline) per neuron bucket
+    NEURON_THRESHOLDS = np.array([0.5, 0.8])
+    NEURON_STYLES = (
+        (EnhancedSciFiTheme.BG_DARK, EnhancedSciFiTheme.GREEN_DIM),
+        (EnhancedSciFiTheme.GREEN_MEDIUM, EnhancedSciFiTheme.GREEN_GLOW),
+        (EnhancedSciFiTheme.GREEN_BRIGHT, EnhancedSciFiTheme.GREEN_BRIGHT),
+    )
+
+    NEURON_RADIUS = 8
+    MAX_DISPLAY_NEURONS = 16
+
+    BACKENDS = ('vector', 'raster')
+    RASTER_MAX_NEURONS = 256
+    RASTER_CONNECTION_RGB = hex_to_rgb(EnhancedSciFiTheme.GREEN_BRIGHT)
+    RASTER_NEURON_LOW_RGB = hex_to_rgb(EnhancedSciFiTheme.GREEN_DARK)
+    RASTER_NEURON_HIGH_RGB = hex_to_rgb(EnhancedSciFiTheme.GREEN_BRIGHT)
+    CONNECTION_UPDATE_RATE = 0.1  # share of connections re-rolled per idle frame
+
+    SELECTIONS = ('spread', 'active', 'variable')
+    SALIENCE_DECAY = 0.05      # EWMA weight of each new activation sample
+    SELECTION_HYSTERESIS = 0.2  # challenger must score this much higher to swap in
+
+    def __init__(self, parent, layers=[20, 64, 32, 8], width=600, height=400,
+                 backend='vector', selection='spread', **kwargs):
         super().__init__(parent, width=width, height=height,
                         bg=EnhancedSciFiTheme.BG_BLACK,
                         highlightthickness=0, **kwargs)
 
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}, expected one of {self.BACKENDS}")
+        if selection not in self.SELECTIONS:
+            raise ValueError(f"Unknown selection {selection!r}, expected one of {self.SELECTIONS}")
+
         self.layers = layers
         self.width = width
         self.height = height
+        self.backend = backend
+        self.selection = selection
         self.neuron_positions = []
-        self.activation_values = {}
         self.animation_frame = 0
+        self.clock = None
+        self.rng = np.random.default_rng()
+        self.simulate = True  # animate synthetic activity until set_activations()
+        self.activation_mailbox = LatestWinsMailbox()
+        self._gui_thread = threading.current_thread()
+
+        # Activation state over the displayed neurons
+        self.display_index = []        # per layer: which real neurons are shown
+        self.neuron_activations = []   # per layer: vector
+        self.connection_activations = []  # per layer pair: matrix
+
+        # Running statistics over every neuron, for salient selection
+        self.salience_mean = []  # per layer: EWMA of |activation|
+        self.salience_var = []   # per layer: EWMA variance of |activation|
+
+        # Persistent items and the bucket each one is drawn with (-1: not yet)
+        self.neuron_items = []
+        self.connection_items = []
+        self.neuron_drawn = []
+        self.connection_drawn = []
+
+        # Raster backend: one image plus precomputed pixel indices
+        self.raster_image = None
+        self.raster_pixels = np.zeros(0, dtype=np.intp)  # every connection pixel
+        self.raster_line_lengths = []  # per layer pair: pixels per line
+        self.raster_alphas = []        # per layer pair: intensity scale
+        self.raster_neuron_pixels = []  # per layer: (neurons, disc pixels)
+        self.raster_rgb = np.zeros((0, 3), dtype=np.uint8)  # reused frame buffer
+
+        self.set_layers(layers)
+        self.start_animation()
 
+    @property
+    def max_display_neurons(self):
+        """Neurons shown per layer by the current backend"""
+        return self.RASTER_MAX_NEURONS if self.backend == 'raster' else self.MAX_DISPLAY_NEURONS
+
+    def set_backend(self, backend):
+        """Switch between the 'vector' and 'raster' backends; activations are reset"""
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}, expected one of {self.BACKENDS}")
+        self.backend = backend
+        self.set_layers(self.layers)
+
+    def set_selection(self, selection):
+        """Choose how wide layers pick the neurons they show"""
+        if selection not in self.SELECTIONS:
+            raise ValueError(f"Unknown selection {selection!r}, expected one of {self.SELECTIONS}")
+        self.selection = selection
+
+    def set_layers(self, layers):
+        """Change the layer sizes, reset activations and rebuild the items"""
+        self.layers = layers
         self.calculate_positions()
-        self.draw_network()
-        self.start_animation()
+
+        displayed = [len(layer) for layer in self.neuron_positions]
+        # Large layers show evenly spaced neurons from across the layer
+        self.display_index = [np.linspace(0, size - 1, shown).astype(np.intp)
+                              for size, shown in zip(layers, displayed)]
+        self.neuron_activations = [np.full(shown, 0.5) for shown in displayed]
+        self.connection_activations = [np.full((a, b), 0.3)
+                                       for a, b in zip(displayed, displayed[1:])]
+        self.salience_mean = [np.zeros(size) for size in layers]
+        self.salience_var = [np.zeros(size) for size in layers]
+        self.build_network()
 
     def calculate_positions(self):
         """Calculate neuron positions"""
@@ -53,7 +253,7 @@ class NeuralNetworkVisualization(Canvas):
             x = (layer_idx + 1) * layer_spacing
 
             # Limit displayed neurons for large layers
-            display_neurons = min(num_neurons, 16)
+            display_neurons = min(num_neurons, self.max_display_neurons)
             neuron_spacing = self.height / (display_neurons + 1)
 
             for neuron_idx in range(display_neurons):
@@ -62,56 +262,16 @@ class NeuralNetworkVisualization(Canvas):
 
             self.neuron_positions.append(layer_positions)
 
-    def draw_network(self):
-        """Draw the neural network"""
+    def build_network(self):
+        """Create every connection, neuron and label item once"""
         self.delete('all')
+        self.connection_items = []
+        self.neuron_items = []
 
-        # Draw connections
-        for layer_idx in range(len(self.neuron_positions) - 1):
-            current_layer = self.neuron_positions[layer_idx]
-            next_layer = self.neuron_positions[layer_idx + 1]
-
-            for i, (x1, y1) in enumerate(current_layer):
-                for j, (x2, y2) in enumerate(next_layer):
-                    # Simulate activation strength
-                    activation = self.activation_values.get((layer_idx, i, j), 0.3)
-
-                    # Color based on activation
-                    if activation > 0.7:
-                        color = EnhancedSciFiTheme.GREEN_BRIGHT
-                        width = 2
-                    elif activation > 0.4:
-                        color = EnhancedSciFiTheme.GREEN_MEDIUM
-                        width = 1
-                    else:
-                        color = EnhancedSciFiTheme.GREEN_DARK
-                        width = 1
-
-                    self.create_line(x1, y1, x2, y2, fill=color,
-                                   width=width, tags='connection')
-
-        # Draw neurons
-        for layer_idx, layer in enumerate(self.neuron_positions):
-            for neuron_idx, (x, y) in enumerate(layer):
-                # Get activation value
-                activation = self.activation_values.get((layer_idx, neuron_idx), 0.5)
-
-                # Color based on activation
-                if activation > 0.8:
-                    fill_color = EnhancedSciFiTheme.GREEN_BRIGHT
-                    outline_color = EnhancedSciFiTheme.GREEN_BRIGHT
-                elif activation > 0.5:
-                    fill_color = EnhancedSciFiTheme.GREEN_MEDIUM
-                    outline_color = EnhancedSciFiTheme.GREEN_GLOW
-                else:
-                    fill_color = EnhancedSciFiTheme.BG_DARK
-                    outline_color = EnhancedSciFiTheme.GREEN_DIM
-
-                radius = 8
-                self.create_oval(x - radius, y - radius,
-                               x + radius, y + radius,
-                               fill=fill_color, outline=outline_color,
-                               width=2, tags='neuron')
+        if self.backend == 'raster':
+            self._build_raster()
+        else:
+            self._build_items()
 
         # Draw layer labels
         for layer_idx, num_neurons in enumerate(self.layers):
@@ -121,336 +281,1633 @@ class NeuralNetworkVisualization(Canvas):
                            fill=EnhancedSciFiTheme.GREEN_GLOW,
                            font=EnhancedSciFiTheme.FONT_MONO_SMALL)
 
+        self.neuron_drawn = [np.full(items.shape, -1) for items in self.neuron_items]
+        self.connection_drawn = [np.full(items.shape, -1) for items in self.connection_items]
+        self.draw_network()
+
+    def _build_items(self):
+        """Vector backend: one line per connection and one oval per neuron"""
+        # Connections first so neurons are drawn over them
+        for layer_idx in range(len(self.neuron_positions) - 1):
+            current_layer = self.neuron_positions[layer_idx]
+            next_layer = self.neuron_positions[layer_idx + 1]
+
+            items = np.array([[self.create_line(x1, y1, x2, y2, tags='connection')
+                               for (x2, y2) in next_layer]
+                              for (x1, y1) in current_layer], dtype=np.int64)
+            self.connection_items.append(items.reshape(len(current_layer), len(next_layer)))
+
+        radius = self.NEURON_RADIUS
+        self.neuron_items = [np.array([self.create_oval(x - radius, y - radius,
+                                                        x + radius, y + radius,
+                                                        width=2, tags='neuron')
+                                       for (x, y) in layer], dtype=np.int64)
+                             for layer in self.neuron_positions]
+
+    def _build_raster(self):
+        """Raster backend: the image item and the pixels every connection and neuron covers"""
+        width, height = int(self.width), int(self.height)
+        self.raster_image = tk.PhotoImage(master=self, width=width, height=height)
+        self.create_image(0, 0, anchor=tk.NW, image=self.raster_image, tags='raster')
+
+        layers = [(np.array([x for x, _ in layer]), np.array([y for _, y in layer]))
+                  for layer in self.neuron_positions]
+
+        # A line between adjacent layers covers one pixel per column between them
+        pixels = []
+        self.raster_line_lengths = []
+        self.raster_alphas = []
+        for (xs1, ys1), (xs2, ys2) in zip(layers, layers[1:]):
+            x1, x2 = xs1[0], xs2[0]
+            columns = np.arange(int(round(x1)), int(round(x2)))
+            t = (columns - x1) / (x2 - x1)
+            rows = ys1[:, None, None] + (ys2[None, :, None] - ys1[:, None, None]) * t
+            rows = np.clip(np.rint(rows), 0, height - 1).astype(np.intp)
+            pixels.append((rows * width + columns).ravel())
+            self.raster_line_lengths.append(len(columns))
+            # Dense layer pairs overlap heavily; scale so they do not saturate
+            self.raster_alphas.append(min(1.0, 8.0 / max(len(ys1), len(ys2))))
+        self.raster_pixels = np.concatenate(pixels) if pixels else np.zeros(0, dtype=np.intp)
+        self.raster_rgb = np.zeros((width * height, 3), dtype=np.uint8)
+
+        # Neurons are discs sized to the spacing of their layer
+        self.raster_neuron_pixels = []
+        for xs, ys in layers:
+            spacing = self.height / (len(ys) + 1)
+            radius = int(max(1, min(self.NEURON_RADIUS, spacing * 0.4)))
+            dy, dx = np.mgrid[-radius:radius + 1, -radius:radius + 1]
+            inside = dx ** 2 + dy ** 2 <= radius ** 2
+            px = np.clip(np.rint(xs[:, None] + dx[inside]), 0, width - 1).astype(np.intp)
+            py = np.clip(np.rint(ys[:, None] + dy[inside]), 0, height - 1).astype(np.intp)
+            self.raster_neuron_pixels.append(py * width + px)
+
+    @instrumented
+    def draw_network(self):
+        """Bring the display up to date with the activation arrays"""
+        if self.backend == 'raster':
+            self._render_raster()
+        else:
+            self._restyle_items()
+
+    def _render_raster(self):
+        """Rasterize every connection and neuron into one PhotoImage"""
+        width, height = int(self.width), int(self.height)
+
+        # Additive glow: each connection contributes its activation to every pixel it covers
+        weights = np.concatenate([np.repeat(activations.ravel() * alpha, length)
+                                  for activations, length, alpha
+                                  in zip(self.connection_activations,
+                                         self.raster_line_lengths, self.raster_alphas)]
+                                 or [np.zeros(0)])
+        glow = np.bincount(self.raster_pixels, weights=weights, minlength=width * height)
+        np.minimum(glow, 1.0, out=glow)
+
+        # Fill the reused buffer one channel at a time
+        rgb = self.raster_rgb
+        for channel, value in enumerate(self.RASTER_CONNECTION_RGB):
+            if value:
+                rgb[:, channel] = glow * value
+            else:
+                rgb[:, channel] = 0
+
+        low, high = self.RASTER_NEURON_LOW_RGB, self.RASTER_NEURON_HIGH_RGB
+        for pixels, activations in zip(self.raster_neuron_pixels, self.neuron_activations):
+            colors = (low + (high - low) * np.clip(activations, 0.0, 1.0)[:, None]).astype(np.uint8)
+            rgb[pixels] = colors[:, None, :]
+
+        self.raster_image.configure(data=rgb_array_to_ppm(rgb.reshape(height, width, 3)),
+                                    format='PPM')
+
+    def _restyle_items(self):
+        """Restyle the items whose activation bucket changed"""
+        for activations, items, drawn in zip(self.connection_activations,
+                                             self.connection_items, self.connection_drawn):
+            buckets = np.searchsorted(self.CONNECTION_THRESHOLDS, activations)
+            for index in np.flatnonzero(buckets != drawn):
+                color, width = self.CONNECTION_STYLES[buckets.flat[index]]
+                self.itemconfigure(int(items.flat[index]), fill=color, width=width)
+            drawn[...] = buckets
+
+        for activations, items, drawn in zip(self.neuron_activations,
+                                             self.neuron_items, self.neuron_drawn):
+            buckets = np.searchsorted(self.NEURON_THRESHOLDS, activations)
+            for index in np.flatnonzero(buckets != drawn):
+                fill_color, outline_color = self.NEURON_STYLES[buckets[index]]
+                self.itemconfigure(int(items[index]), fill=fill_color, outline=outline_color)
+            drawn[...] = buckets
+
     def start_animation(self):
         """Start network activity animation"""
-        self._animate_activity()
+        if self.clock is None:
+            self.clock = FrameScheduler.for_widget(self).subscribe(
+                self, self._animate_activity, 100)
+
+    def stop_animation(self):
+        """Stop network activity animation"""
+        if self.clock is not None:
+            self.clock.cancel()
+            self.clock = None
 
     def _animate_activity(self):
-        """Simulate neural network activity"""
-        # Randomize some activations to show "thinking"
-        for layer_idx in range(len(self.layers)):
-            for neuron_idx in range(min(self.layers[layer_idx], 16)):
-                # Use sine wave for smooth animation
-                base = math.sin(self.animation_frame * 0.1 + neuron_idx * 0.3)
-                activation = (base + 1) / 2  # Normalize to 0-1
-                self.activation_values[(layer_idx, neuron_idx)] = activation
-
-        # Randomize connections
-        for layer_idx in range(len(self.layers) - 1):
-            for i in range(min(self.layers[layer_idx], 16)):
-                for j in range(min(self.layers[layer_idx + 1], 16)):
-                    if random.random() < 0.1:  # 10% chance to update
-                        self.activation_values[(layer_idx, i, j)] = random.random()
+        """Apply the latest published activations, or simulate activity until some arrive"""
+        ready, snapshot = self.activation_mailbox.take()
+        if ready:
+            self.simulate = False
+            self._apply_activations(*snapshot)
+        elif self.simulate:
+            # Smooth sine wave across each layer's neurons
+            phase = self.animation_frame * 0.1
+            for activations in self.neuron_activations:
+                offsets = np.arange(len(activations)) * 0.3
+                activations[:] = (np.sin(phase + offsets) + 1) / 2
+
+            # Re-roll a random share of the connections
+            for activations in self.connection_activations:
+                mask = self.rng.random(activations.shape) < self.CONNECTION_UPDATE_RATE
+                activations[mask] = self.rng.random(np.count_nonzero(mask))
+        else:
+            # Nothing new to show, so leave the canvas (or raster image) alone
+            return
 
         self.draw_network()
         self.animation_frame += 1
-        self.after(100, self._animate_activity)
 
-    def set_activations(self, layer_activations: Dict):
+    def set_activations(self, layer_activations: Union[Dict, Sequence],
+                        weights: Optional[Sequence] = None):
         """Set specific activation values from real neural network"""
-        self.activation_values.update(layer_activations)
+        if threading.current_thread() is not self._gui_thread:
+            self.publish_activations(layer_activations, weights)
+            return
+
+        self._check_shapes(layer_activations, weights)
+        self.simulate = False
+        self._apply_activations(layer_activations, weights)
         self.draw_network()
 
+    def publish_activations(self, layer_activations: Union[Dict, Sequence],
+                            weights: Optional[Sequence] = None):
+        """Thread-safe set_activations(): shown on the next frame, latest wins"""
+        if isinstance(layer_activations, dict):
+            snapshot = dict(layer_activations)
+        else:
+            snapshot = [None if values is None else np.array(values, dtype=float)
+                        for values in layer_activations]
+        if weights is not None:
+            weights = [None if matrix is None else np.array(matrix, dtype=float)
+                       for matrix in weights]
+
+        self._check_shapes(snapshot, weights)
+        self.activation_mailbox.publish((snapshot, weights))
+
+    def _check_shapes(self, layer_activations, weights=None):
+        """Raise ValueError for per-layer arrays that fit neither the full nor the displayed network"""
+        shown = [len(index) for index in self.display_index]
+        if not isinstance(layer_activations, dict):
+            for layer, values in enumerate(layer_activations[:len(self.layers)]):
+                size = None if values is None else np.size(values)
+                if size is not None and size not in (self.layers[layer], shown[layer]):
+                    raise ValueError(f"Layer {layer} expects {self.layers[layer]} or {shown[layer]} "
+                                     f"activations, got {size}")
+
+        for pair, matrix in enumerate((weights or [])[:len(self.layers) - 1]):
+            if matrix is None:
+                continue
+            full = (self.layers[pair], self.layers[pair + 1])
+            displayed = (shown[pair], shown[pair + 1])
+            if np.shape(matrix) not in (full, displayed):
+                raise ValueError(f"Weights {pair} expect shape {full} or {displayed}, "
+                                 f"got {np.shape(matrix)}")
+
+    def _apply_activations(self, layer_activations, weights=None):
+        """Copy activations (and connection signal) into the display arrays"""
+        if isinstance(layer_activations, dict):
+            for key, value in layer_activations.items():
+                if len(key) == 2:
+                    layer, i = key
+                    if layer < len(self.neuron_activations) and i < len(self.neuron_activations[layer]):
+                        self.neuron_activations[layer][i] = value
+                else:
+                    layer, i, j = key
+                    if layer < len(self.connection_activations):
+                        matrix = self.connection_activations[layer]
+                        if i < matrix.shape[0] and j < matrix.shape[1]:
+                            matrix[i, j] = value
+        else:
+            for layer, values in enumerate(layer_activations):
+                if values is not None and layer < len(self.neuron_activations):
+                    values = np.asarray(values, dtype=float).ravel()
+                    if self.selection != 'spread' and values.size == self.layers[layer]:
+                        self._update_selection(layer, np.abs(values))
+                    self.neuron_activations[layer][:] = self._display_values(layer, values)
+
+        if weights is not None:
+            for pair, matrix in enumerate(weights):
+                if matrix is None or pair >= len(self.connection_activations):
+                    continue
+                matrix = np.asarray(matrix, dtype=float)
+                if matrix.shape == (self.layers[pair], self.layers[pair + 1]):
+                    matrix = matrix[np.ix_(self.display_index[pair], self.display_index[pair + 1])]
+
+                signal = np.abs(self.neuron_activations[pair][:, None] * matrix)
+                peak = signal.max()
+                self.connection_activations[pair][:] = signal / peak if peak > 0 else 0.0
+
+    def _update_selection(self, layer, magnitudes):
+        """Fold a full-width sample into the running stats and swap in salient neurons"""
+        mean, var = self.salience_mean[layer], self.salience_var[layer]
+        decay = self.SALIENCE_DECAY
+        delta = magnitudes - mean
+        mean += decay * delta
+        var *= 1.0 - decay
+        var += decay * (1.0 - decay) * delta ** 2
+
+        index = self.display_index[layer]
+        k = len(index)
+        if k >= magnitudes.size:
+            return
+
+        score = mean if self.selection == 'active' else var
+        top = np.argpartition(score, -k)[-k:]
+        shown = np.zeros(magnitudes.size, dtype=bool)
+        shown[index] = True
+        challengers = top[~shown[top]]
+        if not challengers.size:
+            return
+
+        # Strongest challengers against the weakest shown neurons, slot by slot
+        challengers = challengers[np.argsort(score[challengers])[::-1]]
+        weakest_slots = np.argsort(score[index])
+        for challenger, slot in zip(challengers, weakest_slots):
+            if score[challenger] <= score[index[slot]] * (1.0 + self.SELECTION_HYSTERESIS):
+                break
+            index[slot] = challenger
+
+    def _display_values(self, layer, values):
+        """One layer's activations reduced to the displayed neurons, scaled to 0..1"""
+        values = np.abs(np.asarray(values, dtype=float).ravel())
+        shown = len(self.display_index[layer])
+        if values.size != shown:
+            if values.size != self.layers[layer]:
+                raise ValueError(f"Layer {layer} expects {self.layers[layer]} or {shown} "
+                                 f"activations, got {values.size}")
+            values = values[self.display_index[layer]]
+
+        # Unbounded activations (ReLU, logits) are scaled by the layer's peak
+        peak = values.max() if values.size else 0.0
+        return values / peak if peak > 1.0 else values
+
 # ============================================================================
 # THREAT MAP VISUALIZATION
 # ============================================================================
 
-class ThreatMapVisualization(Canvas):
+def hilbert_d2xy(order: int, d) -> Tuple[np.ndarray, np.ndarray]:
+    """Cell coordinates of Hilbert curve positions `d` on a 2**order square"""
+    t = np.array(d, dtype=np.int64)
+    x = np.zeros_like(t)
+    y = np.zeros_like(t)
+    s = 1
+    while s < (1 << order):
+        rx = 1 & (t >> 1)
+        ry = 1 & (t ^ rx)
+        # Rotate the quadrant so the curve stays continuous
+        flip = (ry == 0) & (rx == 1)
+        x[flip] = s - 1 - x[flip]
+        y[flip] = s - 1 - y[flip]
+        swap = ry == 0
+        x[swap], y[swap] = y[swap], x[swap]
+        x += s * rx
+        y += s * ry
+        t >>= 2
+        s <<= 1
+    return x, y
+
+
+def ipv4_to_int(ip_address: str) -> int:
+    """Dotted-quad IPv4 address as an integer"""
+    return int.from_bytes(socket.inet_aton(ip_address), 'big')
+
+
+class HilbertAddressMap:
+    """Lays a CIDR range of IPv4 space out on a Hilbert curve
+
+    Subnets become contiguous blocks; wide ranges fold 2**shift addresses per cell.
+    """
+
+    MAX_ORDER = 9  # at most 512 x 512 cells
+
+    def __init__(self, address_range='0.0.0.0/0', max_order=MAX_ORDER):
+        self.network = ipaddress.IPv4Network(address_range, strict=False)
+        bits = 32 - self.network.prefixlen
+        self.order = min(max_order, (bits + 1) // 2)
+        self.side = 1 << self.order
+        self.shift = max(0, bits - 2 * self.order)
+        self.base = int(self.network.network_address)
+        self.last = int(self.network.broadcast_address)
+
+        used_cells = 1 << (bits - self.shift)
+        table_x, table_y = hilbert_d2xy(self.order, np.arange(used_cells))
+        # Linear (y * side + x) cell for every curve position
+        self.cell_table = table_y * self.side + table_x
+        self.in_range = np.zeros(self.side * self.side, dtype=bool)
+        self.in_range[self.cell_table] = True
+
+    def cells(self, addresses) -> np.ndarray:
+        """Linear cell of each integer address, -1 outside the range"""
+        addresses = np.asarray(addresses, dtype=np.int64)
+        inside = (addresses >= self.base) & (addresses <= self.last)
+        cells = np.full(addresses.shape, -1, dtype=np.int64)
+        cells[inside] = self.cell_table[(addresses[inside] - self.base) >> self.shift]
+        return cells
+
+    def density(self, addresses, weights=None) -> np.ndarray:
+        """Per-cell (weighted) address counts as a flat side * side array"""
+        cells = self.cells(addresses)
+        inside = cells >= 0
+        if weights is not None:
+            weights = np.asarray(weights, dtype=float)[inside]
+        return np.bincount(cells[inside], weights=weights, minlength=self.side * self.side)
+
+
+class ThreatStore:
+    """Bounded, IP-indexed ring buffer of threats in NumPy columns"""
+
+    def __init__(self, capacity=100):
+        self.capacity = max(1, int(capacity))
+        self.ips: List[Optional[str]] = [None] * self.capacity
+        self.x = np.zeros(self.capacity)
+        self.y = np.zeros(self.capacity)
+        self.level = np.zeros(self.capacity, dtype=np.int16)
+        self.hits = np.zeros(self.capacity, dtype=np.int64)
+        self.first_seen = np.zeros(self.capacity)
+        self.last_seen = np.zeros(self.capacity)
+        self.index: Dict[str, int] = {}
+        self.next_slot = 0
+        self.count = 0
+        self.changed = set()
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, ip_address):
+        return ip_address in self.index
+
+    def add(self, ip_address: str, level: int, x: float, y: float,
+            now: Optional[float] = None) -> Tuple[int, bool]:
+        """Record an alert; returns (slot, whether the IP is new)"""
+        now = time.time() if now is None else now
+        slot = self.index.get(ip_address)
+        if slot is not None:
+            self.level[slot] = level
+            self.hits[slot] += 1
+            self.last_seen[slot] = now
+            self.changed.add(slot)
+            return slot, False
+
+        slot = self.next_slot
+        self.next_slot = (slot + 1) % self.capacity
+        evicted = self.ips[slot]
+        if evicted is not None:
+            del self.index[evicted]
+        else:
+            self.count += 1
+
+        self.ips[slot] = ip_address
+        self.index[ip_address] = slot
+        self.x[slot] = x
+        self.y[slot] = y
+        self.level[slot] = level
+        self.hits[slot] = 1
+        self.first_seen[slot] = self.last_seen[slot] = now
+        self.changed.add(slot)
+        return slot, True
+
+    def get(self, ip_address: str) -> Optional[Dict]:
+        """A threat's attributes as a dict, or None"""
+        slot = self.index.get(ip_address)
+        if slot is None:
+            return None
+        return {'ip': ip_address, 'x': float(self.x[slot]), 'y': float(self.y[slot]),
+                'level': int(self.level[slot]), 'hits': int(self.hits[slot]),
+                'first_seen': float(self.first_seen[slot]),
+                'last_seen': float(self.last_seen[slot])}
+
+    def active_slots(self) -> np.ndarray:
+        """Occupied slots, oldest first"""
+        if self.count < self.capacity:
+            return np.arange(self.count)
+        return (self.next_slot + np.arange(self.capacity)) % self.capacity
+
+    def take_changed(self):
+        """Slots added or updated since the last call"""
+        changed, self.changed = self.changed, set()
+        return changed
+
+    def resized(self, capacity) -> 'ThreatStore':
+        """A copy with a new capacity, keeping the newest threats"""
+        store = ThreatStore(capacity)
+        for slot in self.active_slots()[-store.capacity:]:
+            new_slot, _ = store.add(self.ips[slot], int(self.level[slot]),
+                                    self.x[slot], self.y[slot], self.first_seen[slot])
+            store.hits[new_slot] = self.hits[slot]
+            store.last_seen[new_slot] = self.last_seen[slot]
+        return store
+
+
+class ThreatMapVisualization(ZoomPanView, Canvas):
     """Visual threat map showing IP addresses and threat levels"""
 
-    def __init__(self, parent, width=800, height=600, **kwargs):
+    LAYOUTS = ('scatter', 'hilbert')
+    HILBERT_MARGIN = 20
+
+    GRID_SPACING = 50
+    PULSE_STEPS = 10
+
+    CRITICAL_LEVEL = 6
+    MAX_LOD_MARKERS = 200     # critical markers kept over the heatmap
+    HEATMAP_CELL = 8          # px per heatmap bin
+    HEATMAP_REFRESH_MS = 250  # minimum time between heatmap re-renders
+    MAX_ZOOM = 64.0
+
+    # Heatmap colour ramp from empty to hottest cell
+    HEATMAP_STOPS = (EnhancedSciFiTheme.BG_BLACK, EnhancedSciFiTheme.GREEN_DARK,
+                     EnhancedSciFiTheme.THREAT_MEDIUM, EnhancedSciFiTheme.THREAT_HIGH,
+                     EnhancedSciFiTheme.THREAT_CRITICAL)
+    HEATMAP_LUT = color_ramp(HEATMAP_STOPS)
+    ADDRESS_LUT = color_ramp((EnhancedSciFiTheme.BG_DARK, EnhancedSciFiTheme.CYAN_DIM))
+
+    def __init__(self, parent, width=800, height=600, max_threats=100,
+                 lod_threshold=300, layout='scatter', address_range='0.0.0.0/0', **kwargs):
         super().__init__(parent, width=width, height=height,
                         bg=EnhancedSciFiTheme.BG_BLACK,
                         highlightthickness=0, **kwargs)
 
         self.width = width
         self.height = height
-        self.threats = []  # List of (x, y, level, ip) tuples
+        self.store = ThreatStore(max_threats)
+        self.lod_threshold = lod_threshold
+        self.layout = None
+        self.hilbert = None
+        self.threat_cells = np.full(self.store.capacity, -1, dtype=np.int64)
+        self.address_density = None  # per Hilbert cell, from set_address_layer()
+        self.address_colors = None
         self.radar_angle = 0
-
+        self.frame = 0
+        self.clock = None
+
+        self.init_view()
+
+        # Layer state
+        self.static_size = None
+        self.sweep_item = None
+        self.arc_item = None
+        self.heatmap_image = None
+        self.heatmap_item = None
+        self.heatmap_dirty = False
+        self.heatmap_rendered_at = 0.0
+        self.lod_active = False
+
+        # Threat layer: (ring, marker, label) per shown store slot
+        self.threat_items: Dict[int, Tuple[int, int, int]] = {}
+        self.pulse_start = np.zeros(self.store.capacity, dtype=np.int64)
+
+        self.set_layout(layout, address_range)
         self.draw_map()
         self.start_radar()
 
+    @staticmethod
+    def threat_style(level):
+        """(colour, marker radius) for a threat level"""
+        if level >= 6:  # Critical
+            return EnhancedSciFiTheme.THREAT_CRITICAL, 15
+        if level >= 4:  # High
+            return EnhancedSciFiTheme.THREAT_HIGH, 12
+        if level >= 2:  # Medium
+            return EnhancedSciFiTheme.THREAT_MEDIUM, 10
+        return EnhancedSciFiTheme.THREAT_LOW, 8  # Low
+
+    @staticmethod
+    def severity_weight(levels):
+        """Heatmap weight per threat: doubles every two levels"""
+        return np.exp2(np.clip(levels, 0, 10) // 2)
+
     def add_threat(self, ip_address: str, threat_level: int, x: Optional[int] = None,
                    y: Optional[int] = None):
-        """Add a threat to the map"""
-        if x is None:
-            x = random.randint(50, self.width - 50)
-        if y is None:
-            y = random.randint(50, self.height - 50)
-
-        self.threats.append({
-            'ip': ip_address,
-            'x': x,
-            'y': y,
-            'level': threat_level,
-            'pulse': 0
-        })
-
-        # Limit threat history
-        if len(self.threats) > 100:
-            self.threats.pop(0)
-
-    def draw_map(self):
-        """Draw the threat map"""
+        """Add a threat to the map, or refresh it if the IP is already shown"""
+        if ip_address not in self.store and self.layout == 'scatter':
+            if x is None:
+                x = random.randint(50, max(50, self.width - 50))
+            if y is None:
+                y = random.randint(50, max(50, self.height - 50))
+        slot, new = self.store.add(ip_address, threat_level, x or 0, y or 0)
+        if new and self.layout == 'hilbert':
+            self._place_hilbert(np.array([slot]))
+
+    def set_max_threats(self, max_threats):
+        """Change the store capacity, keeping the newest threats"""
+        self._clear_threat_items()
+        self.store = self.store.resized(max_threats)
+        self.pulse_start = np.zeros(self.store.capacity, dtype=np.int64)
+        self.threat_cells = np.full(self.store.capacity, -1, dtype=np.int64)
+        if self.layout == 'hilbert':
+            self._place_hilbert(self.store.active_slots())
+        self.view_dirty = True
+
+    def set_layout(self, layout, address_range=None):
+        """Switch between 'scatter' and 'hilbert' placement, re-placing every threat"""
+        if layout not in self.LAYOUTS:
+            raise ValueError(f"Unknown layout {layout!r}, expected one of {self.LAYOUTS}")
+
+        self.layout = layout
+        slots = self.store.active_slots()
+        if layout == 'hilbert':
+            if address_range is not None or self.hilbert is None:
+                self.hilbert = HilbertAddressMap(address_range or '0.0.0.0/0')
+                self.address_density = None
+                self.address_colors = None
+            self._place_hilbert(slots)
+        else:
+            self.threat_cells[:] = -1
+            self.store.x[slots] = np.random.randint(50, max(51, self.width - 50), len(slots))
+            self.store.y[slots] = np.random.randint(50, max(51, self.height - 50), len(slots))
+
+        self.store.changed.update(slots.tolist())
+        self.static_size = None
+        self.view_dirty = True
+
+    def set_address_layer(self, addresses):
+        """Shade owned or observed addresses (IPv4 strings or ints) under the threats"""
+        if self.layout != 'hilbert':
+            raise ValueError("The address layer needs the 'hilbert' layout")
+
+        addresses = np.asarray(addresses)
+        if addresses.dtype.kind in 'US' or addresses.dtype == object:
+            addresses = np.fromiter((ipv4_to_int(str(ip)) for ip in addresses),
+                                    dtype=np.int64, count=len(addresses))
+        density = self.hilbert.density(addresses)
+
+        peak = density.max()
+        levels = np.log1p(density) * (255.0 / np.log1p(peak)) if peak > 0 else density
+        self.address_density = density
+        self.address_colors = self.ADDRESS_LUT[levels.astype(np.intp)]
+        self.heatmap_dirty = True
+
+    def _hilbert_frame(self):
+        """World origin and size of one Hilbert cell for the current canvas"""
+        side_px = max(1, min(self.width, self.height) - 2 * self.HILBERT_MARGIN)
+        scale = side_px / self.hilbert.side
+        return (self.width - side_px) / 2, (self.height - side_px) / 2, scale
+
+    def _place_hilbert(self, slots):
+        """Position threats at the centre of their address's Hilbert cell"""
+        if not len(slots):
+            return
+        store, hilbert = self.store, self.hilbert
+        addresses = np.fromiter((ipv4_to_int(store.ips[slot]) if self._is_ipv4(store.ips[slot])
+                                 else -1 for slot in slots), dtype=np.int64, count=len(slots))
+        cells = hilbert.cells(addresses)
+        self.threat_cells[slots] = cells
+
+        origin_x, origin_y, scale = self._hilbert_frame()
+        inside = cells >= 0
+        # Addresses outside the range get NaN coordinates and are never in view
+        store.x[slots] = np.where(inside, origin_x + (cells % hilbert.side + 0.5) * scale, np.nan)
+        store.y[slots] = np.where(inside, origin_y + (cells // hilbert.side + 0.5) * scale, np.nan)
+
+    @staticmethod
+    def _is_ipv4(ip_address):
+        """Whether a string parses as a dotted-quad IPv4 address"""
+        try:
+            socket.inet_aton(ip_address)
+        except (OSError, TypeError):
+            return False
+        return ip_address.count('.') == 3
+
+    def _clear_threat_items(self):
+        """Delete every threat item"""
         self.delete('threats')
+        self.threat_items = {}
 
-        # Draw grid
-        grid_spacing = 50
-        for x in range(0, self.width, grid_spacing):
-            self.create_line(x, 0, x, self.height,
-                           fill=EnhancedSciFiTheme.GREEN_DARK,
-                           width=1, tags='grid')
-
-        for y in range(0, self.height, grid_spacing):
-            self.create_line(0, y, self.width, y,
-                           fill=EnhancedSciFiTheme.GREEN_DARK,
-                           width=1, tags='grid')
-
-        # Draw threats
-        for threat in self.threats:
-            x, y = threat['x'], threat['y']
-            level = threat['level']
-            ip = threat['ip']
-
-            # Color based on threat level
-            if level >= 6:  # Critical
-                color = EnhancedSciFiTheme.THREAT_CRITICAL
-                radius = 15
-            elif level >= 4:  # High
-                color = EnhancedSciFiTheme.THREAT_HIGH
-                radius = 12
-            elif level >= 2:  # Medium
-                color = EnhancedSciFiTheme.THREAT_MEDIUM
-                radius = 10
-            else:  # Low
-                color = EnhancedSciFiTheme.THREAT_LOW
-                radius = 8
-
-            # Pulsing effect
-            pulse_offset = threat['pulse'] % 10
-            pulse_radius = radius + pulse_offset
-
-            # Draw pulse rings
-            self.create_oval(x - pulse_radius, y - pulse_radius,
-                           x + pulse_radius, y + pulse_radius,
-                           outline=color, width=1, tags='threats')
-
-            # Draw threat marker
-            self.create_oval(x - radius, y - radius,
-                           x + radius, y + radius,
-                           fill=color, outline=EnhancedSciFiTheme.GREEN_BRIGHT,
-                           width=2, tags='threats')
-
-            # Draw IP label
-            self.create_text(x, y - radius - 10, text=ip,
-                           fill=color, font=EnhancedSciFiTheme.FONT_MONO_SMALL,
-                           tags='threats')
-
-            threat['pulse'] += 1
-
-    def start_radar(self):
-        """Start radar sweep animation"""
-        self._animate_radar()
+    # ------------------------------------------------------------------
+    # Static and radar layers
 
-    def _animate_radar(self):
-        """Animate radar sweep"""
-        self.delete('radar')
+    def on_view_resized(self):
+        """Rebuild the static layer and re-centre the radar for the new size"""
+        if self.layout == 'hilbert':
+            self._place_hilbert(self.store.active_slots())
+        self._build_static_layer()
+        self._update_radar()
 
-        cx = self.width // 2
-        cy = self.height // 2
-        max_radius = min(self.width, self.height) // 2 - 20
+    def _build_static_layer(self):
+        """Draw the grid and radar rings once for the current size"""
+        self.delete('static')
 
-        # Draw radar circles
-        for r in range(max_radius // 4, max_radius, max_radius // 4):
+        cx, cy, max_radius = self._radar_geometry()
+        step = max(1, max_radius // 4)
+        for r in range(step, max_radius, step):
             self.create_oval(cx - r, cy - r, cx + r, cy + r,
                            outline=EnhancedSciFiTheme.CYAN_DIM,
-                           width=1, tags='radar')
+                           width=1, tags=('static', 'radar'))
+
+        for x in range(0, self.width, self.GRID_SPACING):
+            self.create_line(x, 0, x, self.height,
+                           fill=EnhancedSciFiTheme.GREEN_DARK,
+                           width=1, tags=('static', 'grid'))
 
-        # Draw radar sweep line
+        for y in range(0, self.height, self.GRID_SPACING):
+            self.create_line(0, y, self.width, y,
+                           fill=EnhancedSciFiTheme.GREEN_DARK,
+                           width=1, tags=('static', 'grid'))
+
+        if self.layout == 'hilbert':
+            origin_x, origin_y, scale = self._hilbert_frame()
+            extent = scale * self.hilbert.side
+            self.create_rectangle(origin_x, origin_y, origin_x + extent, origin_y + extent,
+                                outline=EnhancedSciFiTheme.CYAN_DIM, width=1,
+                                tags=('static', 'grid'))
+
+        self.tag_lower('static')
+        if self.heatmap_item is not None:
+            self.tag_lower('heatmap')
+        self.static_size = (self.width, self.height)
+
+    def _radar_geometry(self):
+        """Radar centre and radius for the current size"""
+        return self.width // 2, self.height // 2, min(self.width, self.height) // 2 - 20
+
+    def _update_radar(self):
+        """Move the sweep line and fading arc to the current angle"""
+        cx, cy, max_radius = self._radar_geometry()
         angle = math.radians(self.radar_angle)
         x2 = cx + max_radius * math.cos(angle)
         y2 = cy + max_radius * math.sin(angle)
 
-        self.create_line(cx, cy, x2, y2,
-                        fill=EnhancedSciFiTheme.CYAN_BRIGHT,
-                        width=2, tags='radar')
+        if self.sweep_item is None:
+            self.sweep_item = self.create_line(cx, cy, x2, y2,
+                                             fill=EnhancedSciFiTheme.CYAN_BRIGHT,
+                                             width=2, tags='radar')
+            self.arc_item = self.create_arc(cx - max_radius, cy - max_radius,
+                                          cx + max_radius, cy + max_radius,
+                                          outline=EnhancedSciFiTheme.CYAN_DIM,
+                                          width=1, style=tk.ARC, tags='radar')
+            if self.find_withtag('threats'):
+                self.tag_lower('radar', 'threats')
+
+        self.coords(self.sweep_item, cx, cy, x2, y2)
+        self.coords(self.arc_item, cx - max_radius, cy - max_radius,
+                    cx + max_radius, cy + max_radius)
+        self.itemconfigure(self.arc_item, start=self.radar_angle - 30, extent=30)
+
+    # ------------------------------------------------------------------
+    # Threat layer
+
+    @instrumented
+    def draw_map(self):
+        """Bring the threat layer up to date and advance the pulses"""
+        if self.static_size != (self.width, self.height):
+            self._build_static_layer()
+
+        changed = self.store.take_changed()
+        if changed or self.view_dirty:
+            self._update_threat_layer(changed)
+
+        if self.heatmap_dirty:
+            now = time.perf_counter()
+            if (now - self.heatmap_rendered_at) * 1000.0 >= self.HEATMAP_REFRESH_MS:
+                self._render_heatmap()
+                self.heatmap_rendered_at = now
+
+        # Pulsing effect: rings grow a pixel per frame, each from its own start
+        store = self.store
+        frame = self.frame
+        self.frame += 1
+        for slot, (ring, _, _) in self.threat_items.items():
+            x, y = self._to_screen(store.x[slot], store.y[slot])
+            _, radius = self.threat_style(store.level[slot])
+            pulse_radius = radius + (frame - self.pulse_start[slot]) % self.PULSE_STEPS
+            self.coords(ring, x - pulse_radius, y - pulse_radius,
+                        x + pulse_radius, y + pulse_radius)
+
+    def _visible_slots(self):
+        """Store slots whose threat is inside the current view"""
+        store = self.store
+        slots = store.active_slots()
+        x, y = self._to_screen(store.x[slots], store.y[slots])
+        inside = (x >= 0) & (x < self.width) & (y >= 0) & (y < self.height)
+        return slots[inside]
+
+    def _update_threat_layer(self, changed):
+        """Pick detail level and shown markers after threats or the view changed"""
+        store = self.store
+        visible = self._visible_slots()
+        self.lod_active = len(visible) > self.lod_threshold
+        # The Hilbert layout always shows density; scatter only under LOD
+        self.heatmap_dirty = self.lod_active or self.layout == 'hilbert'
+
+        if self.lod_active:
+            # Heatmap for the crowd, markers for the latest critical threats
+            critical = visible[store.level[visible] >= self.CRITICAL_LEVEL]
+            if len(critical) > self.MAX_LOD_MARKERS:
+                newest = np.argpartition(store.last_seen[critical], -self.MAX_LOD_MARKERS)
+                critical = critical[newest[-self.MAX_LOD_MARKERS:]]
+            shown = set(critical.tolist())
+        else:
+            shown = set(visible.tolist())
+            if not self.heatmap_dirty and self.heatmap_item is not None:
+                self.itemconfigure(self.heatmap_item, state='hidden')
+
+        for slot in [slot for slot in self.threat_items if slot not in shown]:
+            for item in self.threat_items.pop(slot):
+                self.delete(item)
+
+        for slot in shown:
+            if slot not in self.threat_items or slot in changed or self.view_dirty:
+                self._draw_threat(slot, slot in changed)
+        self.view_dirty = False
+
+    def _draw_threat(self, slot, changed):
+        """Create or update the items of one shown threat"""
+        store = self.store
+        x, y = self._to_screen(store.x[slot], store.y[slot])
+        color, radius = self.threat_style(store.level[slot])
+        hits = store.hits[slot]
+        text = store.ips[slot] if hits == 1 else f"{store.ips[slot]} ×{hits}"
+
+        items = self.threat_items.get(slot)
+        if items is None:
+            self.threat_items[slot] = (
+                self.create_oval(x - radius, y - radius, x + radius, y + radius,
+                               outline=color, width=1, tags='threats'),
+                self.create_oval(x - radius, y - radius, x + radius, y + radius,
+                               fill=color, outline=EnhancedSciFiTheme.GREEN_BRIGHT,
+                               width=2, tags='threats'),
+                self.create_text(x, y - radius - 10, text=text,
+                               fill=color, font=EnhancedSciFiTheme.FONT_MONO_SMALL,
+                               tags='threats'),
+            )
+        else:
+            ring, marker, label = items
+            if changed:
+                self.itemconfigure(ring, outline=color)
+                self.itemconfigure(marker, fill=color)
+                self.itemconfigure(label, fill=color, text=text)
+            self.coords(marker, x - radius, y - radius, x + radius, y + radius)
+            self.coords(label, x, y - radius - 10)
+
+        if changed and hits == 1:
+            self.pulse_start[slot] = self.frame
+
+    def _render_heatmap(self):
+        """Render the density image for the current layout"""
+        self.heatmap_dirty = False
+        width, height = int(self.width), int(self.height)
+        if self.layout == 'hilbert':
+            rgb = self._hilbert_image(width, height)
+        else:
+            rgb = self._binned_image(width, height)
+
+        ppm = rgb_array_to_ppm(rgb)
+        if self.heatmap_image is None or self.heatmap_image.width() != width \
+                or self.heatmap_image.height() != height:
+            self.heatmap_image = tk.PhotoImage(master=self, width=width, height=height)
+            if self.heatmap_item is None:
+                self.heatmap_item = self.create_image(0, 0, anchor=tk.NW, tags='heatmap')
+            self.itemconfigure(self.heatmap_item, image=self.heatmap_image)
+            self.tag_lower('heatmap')
+        self.heatmap_image.configure(data=ppm, format='PPM')
+        self.itemconfigure(self.heatmap_item, state='normal')
+
+    @staticmethod
+    def _heat_levels(heat):
+        """0..255 LUT index per cell, log scaled so a few hot cells do not wash out the rest"""
+        peak = heat.max() if heat.size else 0
+        levels = np.log1p(heat) * (255.0 / np.log1p(peak)) if peak > 0 else heat
+        return levels.astype(np.intp)
+
+    def _binned_image(self, width, height):
+        """Scatter layout: visible threats binned into HEATMAP_CELL px cells"""
+        store = self.store
+        cell = self.HEATMAP_CELL
+        columns, rows = -(-width // cell), -(-height // cell)
+
+        visible = self._visible_slots()
+        x, y = self._to_screen(store.x[visible], store.y[visible])
+        cells = (y // cell).astype(np.intp) * columns + (x // cell).astype(np.intp)
+        heat = np.bincount(cells, weights=self.severity_weight(store.level[visible]),
+                           minlength=columns * rows)
+
+        rgb = self.HEATMAP_LUT[self._heat_levels(heat)].reshape(rows, columns, 3)
+        return np.repeat(np.repeat(rgb, cell, axis=0), cell, axis=1)[:height, :width]
+
+    def _hilbert_image(self, width, height):
+        """Hilbert layout: threat density per curve cell over the address layer"""
+        store, hilbert = self.store, self.hilbert
+        slots = store.active_slots()
+        cells = self.threat_cells[slots]
+        placed = cells >= 0
+        heat = np.bincount(cells[placed], weights=self.severity_weight(store.level[slots][placed]),
+                           minlength=hilbert.side * hilbert.side)
+
+        # Colour per cell: threats over owned addresses over the empty range
+        if self.address_colors is not None:
+            colors = self.address_colors.copy()
+        else:
+            colors = np.zeros((hilbert.side * hilbert.side, 3), dtype=np.uint8)
+            colors[hilbert.in_range] = self.ADDRESS_LUT[0]
+        hot = heat > 0
+        colors[hot] = self.HEATMAP_LUT[np.maximum(self._heat_levels(heat)[hot], 1)]
+
+        # Which cell every screen column and row falls in under the current view
+        origin_x, origin_y, scale = self._hilbert_frame()
+        world_x = self.view_x + (np.arange(width) + 0.5) / self.zoom
+        world_y = self.view_y + (np.arange(height) + 0.5) / self.zoom
+        cell_x = np.floor((world_x - origin_x) / scale).astype(np.intp)
+        cell_y = np.floor((world_y - origin_y) / scale).astype(np.intp)
+        valid_x = (cell_x >= 0) & (cell_x < hilbert.side)
+        valid_y = (cell_y >= 0) & (cell_y < hilbert.side)
+
+        index = np.clip(cell_y, 0, hilbert.side - 1)[:, None] * hilbert.side \
+            + np.clip(cell_x, 0, hilbert.side - 1)[None, :]
+        rgb = colors[index]
+        rgb[~(valid_y[:, None] & valid_x[None, :])] = 0
+        return rgb
+
+    def start_radar(self):
+        """Start radar sweep animation"""
+        if self.clock is None:
+            self.clock = FrameScheduler.for_widget(self).subscribe(
+                self, self._animate_radar, 50)
 
-        # Draw fading arc
-        self.create_arc(cx - max_radius, cy - max_radius,
-                       cx + max_radius, cy + max_radius,
-                       start=self.radar_angle - 30, extent=30,
-                       outline=EnhancedSciFiTheme.CYAN_DIM,
-                       width=1, style=tk.ARC, tags='radar')
+    def stop_radar(self):
+        """Stop radar sweep animation"""
+        if self.clock is not None:
+            self.clock.cancel()
+            self.clock = None
 
+    def _animate_radar(self):
+        """Animate radar sweep"""
+        self._update_radar()
         self.radar_angle = (self.radar_angle + 2) % 360
         self.draw_map()
-        self.after(50, self._animate_radar)
 
 # ============================================================================
 # NETWORK TOPOLOGY VISUALIZATION
 # ============================================================================
 
-class NetworkTopologyVisualization(Canvas):
+class ForceDirectedLayout:
+    """Fruchterman-Reingold layout that runs on a worker thread
+
+    Grid-approximated repulsion; positions are published to `positions` after each time slice.
+    """
+
+    MIN_GRID = 32
+    MAX_GRID = 128
+    COOLING = 0.95  # per-step temperature decay
+    MIN_TEMPERATURE = 0.25  # px; cooler nodes are settled
+    GRAVITY = 2.0  # pull toward the centre, keeps components on screen
+    SPREAD = 0.5  # ideal edge length as a fraction of sqrt(area / n)
+    GOLDEN_ANGLE = math.pi * (3 - math.sqrt(5))  # spreads stacked nodes evenly
+
+    def __init__(self, width, height, slice_ms=15, margin=30):
+        self.width = width
+        self.height = height
+        self.margin = margin
+        self.slice_ms = slice_ms
+        self.positions = LatestWinsMailbox()  # (n, 2) float arrays
+
+        self._lock = threading.Lock()
+        self._pending = []  # operations queued by the GUI, applied by the worker
+        self._wake = threading.Event()
+        self._thread = None
+        self._running = False
+        self.node_count = 0  # indices handed out to the GUI
+        self.steps = 0
+
+        # Worker-owned state
+        self._count = 0
+        self._pos = np.zeros((64, 2))
+        self._heat = np.zeros(64)
+        self._pinned = np.zeros(64, dtype=bool)
+        self._src = np.zeros(64, dtype=np.intp)
+        self._dst = np.zeros(64, dtype=np.intp)
+        self._edge_count = 0
+        self._kernels = {}  # mesh side -> kernel spectra
+
+    @staticmethod
+    def _mesh_kernel(grid):
+        """FFT of the per-cell-offset repulsion kernel d / |d|^2"""
+        offsets = np.arange(2 * grid)
+        offsets = np.where(offsets < grid, offsets, offsets - 2 * grid).astype(float)
+        dy, dx = np.meshgrid(offsets, offsets, indexing='ij')
+        distance_sq = dx * dx + dy * dy
+        distance_sq[0, 0] = np.inf  # a cell does not repel itself
+        return np.fft.rfft2(dx / distance_sq), np.fft.rfft2(dy / distance_sq)
+
+    # ------------------------------------------------------------------
+    # GUI side: queue changes, the worker applies them between steps
+
+    def add_node(self, x, y, pinned=False) -> int:
+        """Queue a node starting at x, y and return its index"""
+        with self._lock:
+            index = self.node_count
+            self.node_count += 1
+            self._pending.append(('node', index, x, y, pinned))
+        self._wake.set()
+        return index
+
+    def add_edge(self, i, j):
+        """Queue a spring between nodes i and j"""
+        with self._lock:
+            self._pending.append(('edge', i, j))
+        self._wake.set()
+
+    def pin(self, index, x, y):
+        """Queue fixing node `index` at x, y"""
+        with self._lock:
+            self._pending.append(('pin', index, x, y))
+        self._wake.set()
+
+    def resize(self, width, height):
+        """Queue a new layout area"""
+        with self._lock:
+            self._pending.append(('resize', width, height))
+        self._wake.set()
+
+    def start(self):
+        """Start the worker thread"""
+        if self._thread is None:
+            self._running = True
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop the worker thread after its current step"""
+        self._running = False
+        self._wake.set()
+        self._thread = None
+
+    # ------------------------------------------------------------------
+    # Worker side
+
+    def _run(self):
+        """Step in bounded slices, publish, and sleep once converged"""
+        while self._running:
+            self._apply_pending()
+            if self._count == 0 or not (self._heat[:self._count] > 0).any():
+                self._wake.wait()
+                self._wake.clear()
+                continue
+
+            deadline = time.perf_counter() + self.slice_ms / 1000.0
+            while time.perf_counter() < deadline and self._running:
+                self.step()
+            self.positions.publish(self._pos[:self._count].copy())
+            # Yield the GIL so the Tk thread stays responsive
+            time.sleep(self.slice_ms / 4000.0)
+
+    def _apply_pending(self):
+        """Merge queued GUI changes into the worker arrays"""
+        with self._lock:
+            pending, self._pending = self._pending, []
+
+        start_heat = max(self.width, self.height) / 10.0
+        for operation in pending:
+            kind = operation[0]
+            if kind == 'node':
+                _, index, x, y, pinned = operation
+                self._reserve_nodes(index + 1)
+                self._pos[index] = (x, y)
+                self._pinned[index] = pinned
+                self._heat[index] = 0.0 if pinned else start_heat
+                self._count = max(self._count, index + 1)
+            elif kind == 'edge':
+                _, i, j = operation
+                self._reserve_edges(self._edge_count + 1)
+                self._src[self._edge_count] = i
+                self._dst[self._edge_count] = j
+                self._edge_count += 1
+                for end in (i, j):
+                    if not self._pinned[end]:
+                        self._heat[end] = max(self._heat[end], start_heat / 2)
+            elif kind == 'pin':
+                _, index, x, y = operation
+                self._pos[index] = (x, y)
+                self._pinned[index] = True
+                self._heat[index] = 0.0
+            elif kind == 'resize':
+                _, self.width, self.height = operation
+                self._heat[:self._count][~self._pinned[:self._count]] = start_heat / 2
+
+    def _reserve_nodes(self, count):
+        """Grow the node arrays geometrically"""
+        if count > len(self._pos):
+            size = max(count, 2 * len(self._pos))
+            self._pos = np.resize(self._pos, (size, 2))
+            self._heat = np.resize(self._heat, size)
+            self._pinned = np.resize(self._pinned, size)
+
+    def _reserve_edges(self, count):
+        """Grow the edge arrays geometrically"""
+        if count > len(self._src):
+            size = max(count, 2 * len(self._src))
+            self._src = np.resize(self._src, size)
+            self._dst = np.resize(self._dst, size)
+
+    def step(self):
+        """Advance every node one temperature-limited step"""
+        n = self._count
+        pos = self._pos[:n]
+        grid = min(self.MAX_GRID, max(self.MIN_GRID, 1 << math.ceil(math.log2(math.sqrt(n)))))
+        if grid not in self._kernels:
+            self._kernels[grid] = self._mesh_kernel(grid)
+        kernel_x, kernel_y = self._kernels[grid]
+        ideal = self.SPREAD * math.sqrt(self.width * self.height / n)
+
+        # Mesh repulsion: bin, convolve counts with the kernel, sample per node
+        lo = pos.min(axis=0)
+        cell_size = max(float((pos.max(axis=0) - lo).max()), 1.0) / (grid - 1)
+        cells = np.minimum(((pos - lo) / cell_size).astype(np.intp), grid - 1)
+        flat = cells[:, 1] * grid + cells[:, 0]
+        mass = np.bincount(flat, minlength=grid * grid).astype(float)
+
+        padded = np.zeros((2 * grid, 2 * grid))
+        padded[:grid, :grid] = mass.reshape(grid, grid)
+        spectrum = np.fft.rfft2(padded)
+        field_x = np.fft.irfft2(spectrum * kernel_x, s=padded.shape)[:grid, :grid]
+        field_y = np.fft.irfft2(spectrum * kernel_y, s=padded.shape)[:grid, :grid]
+        force = np.column_stack((field_x.ravel()[flat], field_y.ravel()[flat]))
+        force *= ideal * ideal / cell_size
+
+        # Nodes sharing a cell push off its centroid
+        centroid = np.column_stack((np.bincount(flat, pos[:, 0], grid * grid),
+                                    np.bincount(flat, pos[:, 1], grid * grid)))[flat]
+        crowd = mass[flat]
+        centroid /= crowd[:, None]
+        offset = pos - centroid
+        # Nodes stacked on the centroid get a small fixed push, else they never separate
+        stacked = np.flatnonzero((crowd > 1) & (offset == 0).all(axis=1))
+        if len(stacked):
+            angle = stacked * self.GOLDEN_ANGLE
+            offset[stacked] = 0.01 * ideal * np.column_stack((np.cos(angle), np.sin(angle)))
+        distance_sq = (offset * offset).sum(axis=1) + (0.05 * ideal) ** 2
+        force += offset * ((crowd - 1) * ideal * ideal / distance_sq)[:, None]
+
+        # Springs along edges
+        m = self._edge_count
+        if m:
+            src, dst = self._src[:m], self._dst[:m]
+            delta = pos[dst] - pos[src]
+            pull = delta * (np.sqrt((delta * delta).sum(axis=1)) / ideal)[:, None]
+            for axis in (0, 1):
+                force[:, axis] += (np.bincount(src, pull[:, axis], n)
+                                   - np.bincount(dst, pull[:, axis], n))
+
+        centre = np.array([self.width / 2.0, self.height / 2.0])
+        force -= self.GRAVITY * (pos - centre)
+
+        # Move at most each node's temperature, then cool
+        heat = self._heat[:n]
+        magnitude = np.sqrt((force * force).sum(axis=1)) + 1e-9
+        pos += force * (np.minimum(magnitude, heat) / magnitude)[:, None]
+        free = ~self._pinned[:n]  # pinned nodes stay exactly where they were put
+        pos[free] = np.clip(pos[free], self.margin,
+                            (max(self.margin, self.width - self.margin),
+                             max(self.margin, self.height - self.margin)))
+
+        heat *= self.COOLING
+        heat[heat < self.MIN_TEMPERATURE] = 0.0
+        self.steps += 1
+
+
+class SpatialGrid:
+    """Uniform-grid index of moving points for rectangle queries"""
+
+    def __init__(self, cell_size=64.0):
+        self.cell_size = cell_size
+        self.cells = {}  # {(column, row): {key, ...}}
+        self.cell_of = {}  # {key: (column, row)}
+
+    def _cell(self, x, y):
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def move(self, key, x, y):
+        """Insert `key` at x, y, or move it there"""
+        cell = self._cell(x, y)
+        old = self.cell_of.get(key)
+        if old == cell:
+            return
+        if old is not None:
+            members = self.cells[old]
+            members.discard(key)
+            if not members:
+                del self.cells[old]
+        self.cells.setdefault(cell, set()).add(key)
+        self.cell_of[key] = cell
+
+    def query(self, x0, y0, x1, y1) -> List:
+        """Keys in the cells overlapping a rectangle (a superset of those inside it)"""
+        column0, row0 = self._cell(x0, y0)
+        column1, row1 = self._cell(x1, y1)
+        if (column1 - column0 + 1) * (row1 - row0 + 1) > len(self.cells):
+            # Sparse grid or huge rectangle: cheaper to walk the occupied cells
+            hits = (members for (column, row), members in self.cells.items()
+                    if column0 <= column <= column1 and row0 <= row <= row1)
+        else:
+            hits = (self.cells.get((column, row), ())
+                    for column in range(column0, column1 + 1)
+                    for row in range(row0, row1 + 1))
+        keys = []
+        for members in hits:
+            keys.extend(members)
+        return keys
+
+
+class NetworkTopologyVisualization(ZoomPanView, Canvas):
     """Network topology graph visualization"""
 
-    def __init__(self, parent, width=800, height=600, **kwargs):
+    LAYOUTS = ('force', 'random')
+    LAYOUT_MOVE_PX = 0.5  # smaller layout moves are not redrawn
+    LAYOUT_MOVES_PER_FRAME = 1500  # largest moves first, the rest next frame
+
+    NODE_SHAPES = {'server': ('square', 20), 'router': ('diamond', 18)}
+    DEFAULT_SHAPE = ('circle', 15)  # hosts and anything unrecognised
+
+    MAX_PACKETS = 4096  # edges with a packet in flight
+    PACKET_POOL = 256  # packet markers drawn per frame
+    PACKET_STEP = 0.02  # progress per frame
+    PACKET_RADIUS = 5
+
+    LABEL_ZOOM = 2.0
+    LABEL_NODE_LIMIT = 150
+    VIEW_MARGIN_PX = 40  # node radius plus label, so edge-straddling nodes are drawn
+
+    def __init__(self, parent, width=800, height=600, layout='force', **kwargs):
         super().__init__(parent, width=width, height=height,
                         bg=EnhancedSciFiTheme.BG_BLACK,
                         highlightthickness=0, **kwargs)
 
+        if layout not in self.LAYOUTS:
+            raise ValueError(f"Unknown layout {layout!r}, expected one of {self.LAYOUTS}")
+
         self.width = width
         self.height = height
-        self.nodes = {}  # {ip: {'x': x, 'y': y, 'connections': []}}
-        self.packets = []  # Animated packets traveling between nodes
+        self.nodes = {}  # {ip: {'x': x, 'y': y, 'connections': set()}}
+        self.node_ips = []  # node index -> ip
+        self.node_xy = np.zeros((64, 2))  # drawn position by node index
+        self.clock = None
+
+        # Animated packets traveling between nodes, one slot per busy edge
+        self.packet_src = np.zeros(self.MAX_PACKETS, dtype=np.intp)
+        self.packet_dst = np.zeros(self.MAX_PACKETS, dtype=np.intp)
+        self.packet_progress = np.zeros(self.MAX_PACKETS)
+        self.packet_count = np.zeros(self.MAX_PACKETS, dtype=np.int64)
+        self.packet_active = np.zeros(self.MAX_PACKETS, dtype=bool)
+        self.packet_slots = {}  # {(src index, dst index): slot}
+        self.free_packet_slots = list(range(self.MAX_PACKETS - 1, -1, -1))
+        self.packets_dropped = 0
+        self.packet_markers = []  # pool of (oval, count text) items
+        self.marker_counts = []  # count each pooled marker's text shows
+        self.markers_shown = 0
+
+        self.node_items = {}  # {ip: (shape, shape item, label item or None)}
+        self.edge_items = {}  # {(ip1, ip2) sorted: line item}
+        self.incident_edges = {}  # {ip: {edge key, ...}}
+        self.edge_keys = []  # every edge, in insertion order
+        self.edge_id = {}  # {edge key: position in edge_keys}
+        self.edge_ends = np.zeros((64, 2), dtype=np.intp)  # node indices per edge key
+        self.dirty_nodes = set()  # nodes whose items are stale
+        self.new_edges = set()  # edges without a line item yet
+
+        self.init_view()
+        self.spatial_index = SpatialGrid()
+        self.visible_nodes = set()  # nodes with canvas items
+        self.labels_shown = True
+
+        self.layout = ForceDirectedLayout(width, height) if layout == 'force' else None
+        self.layout_applied = np.zeros((0, 2))  # positions last drawn, by node index
+        self.layout_target = None  # newest published positions
 
         self.draw_topology()
         self.start_packet_animation()
+        self.start_layout()
+        self.bind('<Destroy>', lambda event: self.stop_layout() if event.widget is self else None,
+                  add='+')
 
     def add_node(self, ip_address: str, node_type: str = 'host',
                  x: Optional[int] = None, y: Optional[int] = None):
-        """Add a node to the topology"""
+        """Add a node to the topology, pinned if x and y are given"""
         if ip_address not in self.nodes:
-            if x is None or y is None:
-                x = random.randint(100, self.width - 100)
-                y = random.randint(100, self.height - 100)
+            pinned = x is not None and y is not None
+            if not pinned:
+                x = random.randint(100, max(100, self.width - 100))
+                y = random.randint(100, max(100, self.height - 100))
 
+            index = len(self.node_ips)
             self.nodes[ip_address] = {
                 'x': x,
                 'y': y,
                 'type': node_type,
-                'connections': [],
+                'connections': set(),
                 'active': True,
-                'threat_level': 0
+                'threat_level': 0,
+                'index': index
             }
+            self.node_ips.append(ip_address)
+            if index >= len(self.node_xy):
+                self.node_xy = np.resize(self.node_xy, (2 * len(self.node_xy), 2))
+            self.incident_edges[ip_address] = set()
+            self._move_node(ip_address, x, y)
+
+            if self.layout is not None:
+                self.layout.add_node(x, y, pinned)  # same index as ours
+
+    def update_node(self, ip_address: str, threat_level: Optional[int] = None,
+                    node_type: Optional[str] = None, x: Optional[float] = None,
+                    y: Optional[float] = None):
+        """Change a node's threat level, type or position (pinning it there)"""
+        node = self.nodes.get(ip_address)
+        if node is None:
+            return
+
+        if self.layout is not None and x is not None and y is not None:
+            self.layout.pin(node['index'], x, y)
+
+        changes = {'threat_level': threat_level, 'type': node_type}
+        for key, value in changes.items():
+            if value is not None and node[key] != value:
+                node[key] = value
+                self.dirty_nodes.add(ip_address)
+        if x is not None and y is not None:
+            self._move_node(ip_address, x, y)
+
+    def _move_node(self, ip_address, x, y):
+        """Set a node's position, keeping the packet and spatial indexes current"""
+        node = self.nodes[ip_address]
+        node['x'], node['y'] = x, y
+        self.node_xy[node['index']] = (x, y)
+        self.spatial_index.move(ip_address, x, y)
+        self.dirty_nodes.add(ip_address)
 
     def add_connection(self, ip1: str, ip2: str):
         """Add connection between nodes"""
         if ip1 in self.nodes and ip2 in self.nodes:
             if ip2 not in self.nodes[ip1]['connections']:
-                self.nodes[ip1]['connections'].append(ip2)
-
-            # Create animated packet
-            self.packets.append({
-                'from': ip1,
-                'to': ip2,
-                'progress': 0.0,
-                'color': EnhancedSciFiTheme.GREEN_BRIGHT
-            })
+                self.nodes[ip1]['connections'].add(ip2)
+                edge = self._edge_key(ip1, ip2)
+                if edge not in self.incident_edges[ip1]:
+                    self.new_edges.add(edge)
+                    self.incident_edges[ip1].add(edge)
+                    self.incident_edges[ip2].add(edge)
+                    if len(self.edge_keys) >= len(self.edge_ends):
+                        self.edge_ends = np.resize(self.edge_ends, (2 * len(self.edge_ends), 2))
+                    self.edge_ends[len(self.edge_keys)] = (self.nodes[edge[0]]['index'],
+                                                           self.nodes[edge[1]]['index'])
+                    self.edge_id[edge] = len(self.edge_keys)
+                    self.edge_keys.append(edge)
+                    if self.layout is not None:
+                        self.layout.add_edge(self.nodes[ip1]['index'],
+                                             self.nodes[ip2]['index'])
+
+            self.send_packet(ip1, ip2)
+
+    def send_packet(self, ip1: str, ip2: str):
+        """Animate a packet from ip1 to ip2, coalescing with one already in flight"""
+        if ip1 not in self.nodes or ip2 not in self.nodes:
+            return
+        key = (self.nodes[ip1]['index'], self.nodes[ip2]['index'])
+        slot = self.packet_slots.get(key)
+        if slot is not None:
+            self.packet_count[slot] += 1
+            return
+        if not self.free_packet_slots:
+            self.packets_dropped += 1
+            return
 
+        slot = self.free_packet_slots.pop()
+        self.packet_slots[key] = slot
+        self.packet_src[slot], self.packet_dst[slot] = key
+        self.packet_progress[slot] = 0.0
+        self.packet_count[slot] = 1
+        self.packet_active[slot] = True
+
+    @staticmethod
+    def _edge_key(ip1, ip2):
+        """One line per node pair, whichever direction was connected"""
+        return (ip1, ip2) if ip1 <= ip2 else (ip2, ip1)
+
+    @classmethod
+    def node_style(cls, node):
+        """Shape, radius and colour for a node's type and threat level"""
+        shape, radius = cls.NODE_SHAPES.get(node['type'], cls.DEFAULT_SHAPE)
+
+        threat_level = node.get('threat_level', 0)
+        if threat_level > 5:
+            color = EnhancedSciFiTheme.THREAT_CRITICAL
+        elif threat_level > 3:
+            color = EnhancedSciFiTheme.THREAT_HIGH
+        elif threat_level > 1:
+            color = EnhancedSciFiTheme.THREAT_MEDIUM
+        else:
+            color = EnhancedSciFiTheme.GREEN_GLOW
+        return shape, radius, color
+
+    @staticmethod
+    def _shape_coords(shape, x, y, radius):
+        """Canvas coordinates of a node shape centred on x, y"""
+        if shape == 'diamond':
+            return (x, y - radius, x + radius, y, x, y + radius, x - radius, y)
+        return (x - radius, y - radius, x + radius, y + radius)
+
+    # ------------------------------------------------------------------
+    # View
+
+    def on_view_resized(self):
+        """Let the layout spread into the new area"""
+        if self.layout is not None:
+            self.layout.resize(self.width, self.height)
+
+    def _view_rect(self):
+        """World rectangle in which nodes get items"""
+        margin = self.VIEW_MARGIN_PX / self.zoom
+        return (self.view_x - margin, self.view_y - margin,
+                self.view_x + self.width / self.zoom + margin,
+                self.view_y + self.height / self.zoom + margin)
+
+    # ------------------------------------------------------------------
+    # Nodes and edges
+
+    @instrumented
     def draw_topology(self):
-        """Draw the network topology"""
-        self.delete('topology')
-
-        # Draw connections
-        for ip, node in self.nodes.items():
-            x1, y1 = node['x'], node['y']
-
-            for connected_ip in node['connections']:
-                if connected_ip in self.nodes:
-                    connected_node = self.nodes[connected_ip]
-                    x2, y2 = connected_node['x'], connected_node['y']
-
-                    # Draw connection line
-                    self.create_line(x1, y1, x2, y2,
-                                   fill=EnhancedSciFiTheme.GREEN_DIM,
-                                   width=1, tags='topology')
-
-        # Draw nodes
-        for ip, node in self.nodes.items():
-            x, y = node['x'], node['y']
-            node_type = node['type']
-            threat_level = node.get('threat_level', 0)
-
-            # Size and color based on type and threat
-            if node_type == 'server':
-                radius = 20
-                shape = 'square'
-            elif node_type == 'router':
-                radius = 18
-                shape = 'diamond'
-            else:  # host
-                radius = 15
-                shape = 'circle'
-
-            # Color based on threat level
-            if threat_level > 5:
-                color = EnhancedSciFiTheme.THREAT_CRITICAL
-            elif threat_level > 3:
-                color = EnhancedSciFiTheme.THREAT_HIGH
-            elif threat_level > 1:
-                color = EnhancedSciFiTheme.THREAT_MEDIUM
-            else:
-                color = EnhancedSciFiTheme.GREEN_GLOW
+        """Bring the items of new and changed nodes and edges up to date"""
+        if self.view_dirty:
+            self._update_viewport()
+            return
 
-            # Draw node shape
+        x0, y0, x1, y1 = self._view_rect()
+        touched_edges = self.new_edges
+        for ip in self.dirty_nodes:
+            node = self.nodes[ip]
+            if x0 <= node['x'] <= x1 and y0 <= node['y'] <= y1:
+                self.visible_nodes.add(ip)
+                self._draw_node(ip)
+            elif ip in self.visible_nodes:
+                self.visible_nodes.discard(ip)
+                self._delete_node_items(ip)
+            # Even a node culled before and after may drag a line across the view
+            touched_edges.update(self.incident_edges[ip])
+        self.dirty_nodes.clear()
+
+        self._sync_edges([self.edge_id[edge] for edge in touched_edges])
+        self.new_edges = set()
+
+        labels_shown = self._labels_wanted()
+        if labels_shown != self.labels_shown:
+            self.view_dirty = True  # add or drop labels on every visible node next frame
+
+    def _labels_wanted(self):
+        """Labels only when zoomed in or when few nodes are in view"""
+        return self.zoom >= self.LABEL_ZOOM or len(self.visible_nodes) <= self.LABEL_NODE_LIMIT
+
+    def _update_viewport(self):
+        """Redraw for a new view: items only for what is inside it"""
+        x0, y0, x1, y1 = self._view_rect()
+        visible = {ip for ip in self.spatial_index.query(x0, y0, x1, y1)
+                   if x0 <= self.nodes[ip]['x'] <= x1 and y0 <= self.nodes[ip]['y'] <= y1}
+
+        for ip in self.visible_nodes - visible:
+            self._delete_node_items(ip)
+        self.visible_nodes = visible
+        self.labels_shown = self._labels_wanted()
+        for ip in visible:
+            # A pan or zoom only moves unchanged nodes
+            self._draw_node(ip, restyle=ip in self.dirty_nodes)
+
+        count = len(self.edge_keys)
+        ends = self.edge_ends[:count]
+        crossing = np.flatnonzero(self._segments_in_rect(
+            self.node_xy[ends[:, 0]], self.node_xy[ends[:, 1]], (x0, y0, x1, y1)))
+        edges = {self.edge_keys[i] for i in crossing.tolist()}
+        for edge in [edge for edge in self.edge_items if edge not in edges]:
+            self.delete(self.edge_items.pop(edge))
+        self._sync_edges(crossing, known_crossing=True)
+
+        self.dirty_nodes.clear()
+        self.new_edges = set()
+        self.view_dirty = False
+
+    @staticmethod
+    def _segments_in_rect(start, end, rect):
+        """Which segments start[i] -> end[i] touch rect (Liang-Barsky clipping)"""
+        x0, y0, x1, y1 = rect
+        delta = end - start
+        enter = np.zeros(len(start))
+        leave = np.ones(len(start))
+        inside = np.ones(len(start), dtype=bool)
+        for p, q in ((-delta[:, 0], start[:, 0] - x0), (delta[:, 0], x1 - start[:, 0]),
+                     (-delta[:, 1], start[:, 1] - y0), (delta[:, 1], y1 - start[:, 1])):
+            parallel = p == 0
+            inside &= ~(parallel & (q < 0))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                ratio = q / p
+            enter = np.where(p < 0, np.maximum(enter, ratio), enter)
+            leave = np.where(p > 0, np.minimum(leave, ratio), leave)
+        return inside & (enter <= leave)
+
+    def _sync_edges(self, indices, known_crossing=False):
+        """Create, move or delete lines (by edge_keys index) to match the view"""
+        indices = np.asarray(indices, dtype=np.intp)
+        if not len(indices):
+            return
+        ends = self.edge_ends[indices]
+        start, end = self.node_xy[ends[:, 0]], self.node_xy[ends[:, 1]]
+        if known_crossing:
+            crossing = np.ones(len(indices), dtype=bool)
+        else:
+            crossing = self._segments_in_rect(start, end, self._view_rect())
+        origin = (self.view_x, self.view_y)
+        screen = np.hstack(((start - origin) * self.zoom, (end - origin) * self.zoom))
+
+        for index, drawn, (x1, y1, x2, y2) in zip(indices.tolist(), crossing.tolist(),
+                                                  screen.tolist()):
+            edge = self.edge_keys[index]
+            if drawn:
+                line = self.edge_items.get(edge)
+                if line is None:
+                    # Lowered, so nodes stay on top of lines
+                    line = self.create_line(x1, y1, x2, y2,
+                                            fill=EnhancedSciFiTheme.GREEN_DIM,
+                                            width=1, tags=('topology', 'edge'))
+                    self.tag_lower(line)
+                    self.edge_items[edge] = line
+                else:
+                    self.coords(line, x1, y1, x2, y2)
+            elif edge in self.edge_items:
+                self.delete(self.edge_items.pop(edge))
+
+    def _delete_node_items(self, ip):
+        """Drop the items of a node that left the view"""
+        _, shape_item, label = self.node_items.pop(ip)
+        self.delete(shape_item)
+        if label is not None:
+            self.delete(label)
+
+    def _draw_node(self, ip, restyle=True):
+        """Create or update the shape and label of one visible node"""
+        node = self.nodes[ip]
+        x, y = self._to_screen(node['x'], node['y'])
+        shape, radius, color = self.node_style(node)
+        coords = self._shape_coords(shape, x, y, radius)
+
+        items = self.node_items.get(ip)
+        if items is not None and items[0] != shape:
+            # Type changed to a different shape: only the shape item is replaced
+            self.delete(items[1])
+            items = (shape, None, items[2])
+
+        if items is None or items[1] is None:
+            options = dict(fill=EnhancedSciFiTheme.BG_MEDIUM, outline=color, width=3,
+                           tags=('topology', 'node'))
             if shape == 'circle':
-                self.create_oval(x - radius, y - radius,
-                               x + radius, y + radius,
-                               fill=EnhancedSciFiTheme.BG_MEDIUM,
-                               outline=color, width=3, tags='topology')
+                shape_item = self.create_oval(*coords, **options)
             elif shape == 'square':
-                self.create_rectangle(x - radius, y - radius,
-                                    x + radius, y + radius,
-                                    fill=EnhancedSciFiTheme.BG_MEDIUM,
-                                    outline=color, width=3, tags='topology')
-            elif shape == 'diamond':
-                points = [x, y - radius, x + radius, y,
-                         x, y + radius, x - radius, y]
-                self.create_polygon(points, fill=EnhancedSciFiTheme.BG_MEDIUM,
-                                  outline=color, width=3, tags='topology')
-
-            # Draw IP label
-            self.create_text(x, y + radius + 15, text=ip,
-                           fill=color, font=EnhancedSciFiTheme.FONT_MONO_SMALL,
-                           tags='topology')
-
+                shape_item = self.create_rectangle(*coords, **options)
+            else:
+                shape_item = self.create_polygon(*coords, **options)
+            label = items[2] if items is not None else None
+            if label is not None:
+                self.tag_lower(shape_item, label)
+        else:
+            _, shape_item, label = items
+            self.coords(shape_item, *coords)
+            if restyle:
+                self.itemconfigure(shape_item, outline=color)
+
+        if not self.labels_shown:
+            if label is not None:
+                self.delete(label)
+                label = None
+        elif label is None:
+            label = self.create_text(x, y + radius + 15, text=ip,
+                                     fill=color, font=EnhancedSciFiTheme.FONT_MONO_SMALL,
+                                     tags=('topology', 'label'))
+        else:
+            self.coords(label, x, y + radius + 15)
+            if restyle:
+                self.itemconfigure(label, fill=color)
+        self.node_items[ip] = (shape, shape_item, label)
+
+    @instrumented
     def draw_packets(self):
-        """Draw animated packets"""
-        self.delete('packets')
-
-        packets_to_remove = []
-
-        for i, packet in enumerate(self.packets):
-            from_ip = packet['from']
-            to_ip = packet['to']
-
-            if from_ip in self.nodes and to_ip in self.nodes:
-                from_node = self.nodes[from_ip]
-                to_node = self.nodes[to_ip]
-
-                # Calculate packet position
-                progress = packet['progress']
-                x = from_node['x'] + (to_node['x'] - from_node['x']) * progress
-                y = from_node['y'] + (to_node['y'] - from_node['y']) * progress
-
-                # Draw packet
-                radius = 5
-                self.create_oval(x - radius, y - radius,
-                               x + radius, y + radius,
-                               fill=packet['color'],
-                               outline=EnhancedSciFiTheme.GREEN_BRIGHT,
-                               tags='packets')
-
-                # Update progress
-                packet['progress'] += 0.02
-
-                if packet['progress'] >= 1.0:
-                    packets_to_remove.append(i)
-
-        # Remove completed packets
-        for i in reversed(packets_to_remove):
-            self.packets.pop(i)
+        """Advance packets together and draw the busiest with pooled markers"""
+        active = np.flatnonzero(self.packet_active)
+        self.packet_progress[active] += self.PACKET_STEP
+
+        arrived = active[self.packet_progress[active] >= 1.0]
+        if len(arrived):
+            self.packet_active[arrived] = False
+            for slot in arrived.tolist():
+                del self.packet_slots[(self.packet_src[slot], self.packet_dst[slot])]
+                self.free_packet_slots.append(slot)
+            active = np.flatnonzero(self.packet_active)
+
+        # Screen positions, keeping only packets inside the view
+        src_xy = self.node_xy[self.packet_src[active]]
+        dst_xy = self.node_xy[self.packet_dst[active]]
+        xy = src_xy + (dst_xy - src_xy) * self.packet_progress[active, None]
+        xy = (xy - (self.view_x, self.view_y)) * self.zoom
+        inside = ((xy[:, 0] >= 0) & (xy[:, 0] < self.width)
+                  & (xy[:, 1] >= 0) & (xy[:, 1] < self.height))
+        active, xy = active[inside], xy[inside]
+
+        if len(active) > self.PACKET_POOL:
+            busiest = np.argpartition(self.packet_count[active], -self.PACKET_POOL)
+            keep = busiest[-self.PACKET_POOL:]
+            active, xy = active[keep], xy[keep]
+        counts = self.packet_count[active]
+
+        while len(self.packet_markers) < len(active):
+            oval = self.create_oval(0, 0, 0, 0, fill=EnhancedSciFiTheme.GREEN_BRIGHT,
+                                    outline=EnhancedSciFiTheme.GREEN_BRIGHT, tags='packets')
+            text = self.create_text(0, 0, text='', fill=EnhancedSciFiTheme.GREEN_BRIGHT,
+                                    font=EnhancedSciFiTheme.FONT_MONO_SMALL, anchor='w',
+                                    tags='packets')
+            self.packet_markers.append((oval, text))
+            self.marker_counts.append(1)
+
+        shown = len(active)
+        markers = zip(self.packet_markers, xy.tolist(), counts.tolist())
+        for index, ((oval, text), (x, y), count) in enumerate(markers):
+            # Coalesced packets grow a little and show their count
+            radius = self.PACKET_RADIUS + min(4, count.bit_length() - 1)
+            self.coords(oval, x - radius, y - radius, x + radius, y + radius)
+            self.coords(text, x + radius + 2, y)
+            if count != self.marker_counts[index]:
+                self.itemconfigure(text, text=f'x{count}' if count > 1 else '')
+                self.marker_counts[index] = count
+            if index >= self.markers_shown:
+                self.itemconfigure(oval, state='normal')
+                self.itemconfigure(text, state='normal')
+
+        for oval, text in self.packet_markers[shown:self.markers_shown]:
+            self.itemconfigure(oval, state='hidden')
+            self.itemconfigure(text, state='hidden')
+        self.markers_shown = shown
 
     def start_packet_animation(self):
         """Start packet animation"""
-        self._animate_packets()
+        if self.clock is None:
+            self.clock = FrameScheduler.for_widget(self).subscribe(
+                self, self._animate_packets, 50)
+
+    def stop_packet_animation(self):
+        """Stop packet animation"""
+        if self.clock is not None:
+            self.clock.cancel()
+            self.clock = None
+
+    def start_layout(self):
+        """Start the force-directed layout worker"""
+        if self.layout is not None:
+            self.layout.start()
+
+    def stop_layout(self):
+        """Stop the force-directed layout worker"""
+        if self.layout is not None:
+            self.layout.stop()
+
+    def _apply_layout(self):
+        """Move the nodes the newest published layout has shifted"""
+        ready, positions = self.layout.positions.take()
+        if ready:
+            self.layout_target = positions
+        positions = self.layout_target
+        if positions is None:
+            return
+
+        applied = self.layout_applied
+        if len(positions) > len(applied):
+            # Newcomers were drawn where they started
+            start = [(self.nodes[ip]['x'], self.nodes[ip]['y'])
+                     for ip in self.node_ips[len(applied):len(positions)]]
+            applied = np.vstack((applied, start))
+        shift = np.abs(positions - applied[:len(positions)]).max(axis=1)
+        moved = np.flatnonzero(shift > self.LAYOUT_MOVE_PX)
+        if len(moved) > self.LAYOUT_MOVES_PER_FRAME:
+            largest = np.argpartition(shift[moved], -self.LAYOUT_MOVES_PER_FRAME)
+            moved = moved[largest[-self.LAYOUT_MOVES_PER_FRAME:]]
+        applied[moved] = positions[moved]
+        self.layout_applied = applied
+
+        if not len(moved):
+            self.layout_target = None  # fully drawn; wait for the next publish
+        for index, (x, y) in zip(moved.tolist(), positions[moved].tolist()):
+            self._move_node(self.node_ips[index], x, y)
 
     def _animate_packets(self):
         """Animate network packets"""
-        self.draw_packets()
+        if self.layout is not None:
+            self._apply_layout()
         self.draw_topology()
-        self.after(50, self._animate_packets)
+        self.draw_packets()
 
 # ============================================================================
 # REAL-TIME GRAPH WIDGET
@@ -484,6 +1941,7 @@ class RealTimeGraph(Canvas):
         self.data_points.append(value)
         self.draw_graph()
 
+    @instrumented
     def draw_graph(self):
         """Draw the graph"""
         self.delete('all')
@@ -557,18 +2015,30 @@ class MatrixRainBackground(Canvas):
         self.streams = []
         self.chars = "アイウエオカキクケコサシスセソタチツテトナニヌネノハヒフヘホマミムメモヤユヨラリルレロワヲン01"
         self.running = False
+        self.clock = None
+        self.quality_step = 1  # draw every n-th stream
 
         self.bind('<Configure>', self._on_resize)
+        FrameRateGovernor.for_widget(self).register(self)
 
     def start(self):
         """Start matrix rain"""
         self.running = True
         self._initialize_streams()
-        self._animate()
+        if self.clock is None:
+            self.clock = FrameScheduler.for_widget(self).subscribe(
+                self, self._animate, 50, decorative=True)
 
     def stop(self):
         """Stop matrix rain"""
         self.running = False
+        if self.clock is not None:
+            self.clock.cancel()
+            self.clock = None
+
+    def set_render_quality(self, quality):
+        """Draw every stream at full quality, every 2nd or 4th one below it"""
+        self.quality_step = max(1, int(round(1.0 / quality)))
 
     def _on_resize(self, event):
         """Handle resize"""
@@ -598,7 +2068,7 @@ class MatrixRainBackground(Canvas):
 
         h = self.winfo_height() or 600
 
-        for stream in self.streams:
+        for stream in self.streams[::self.quality_step]:
             stream['y'] += stream['speed']
 
             if stream['y'] > h + 100:
@@ -626,8 +2096,6 @@ class MatrixRainBackground(Canvas):
                                    fill=color, font=EnhancedSciFiTheme.FONT_MONO,
                                    tags='rain')
 
-        self.after(50, self._animate)
-
 # Test components
 if __name__ == "__main__":
     print("ARCHITECT v3.0 Enhanced GUI - Part 2: Advanced Visualization Panels")
@@ -14,7 +14,7 @@ import time
 from datetime import datetime
 
 sys.path.insert(0, '/home/cdavenport795/ARCHITECT SYSTEM')
-from ARCHITECT_SA_v3_0_ENHANCED_GUI_PART1 import EnhancedSciFiTheme, GlowButton
+from ARCHITECT_SA_v3_0_ENHANCED_GUI_PART1 import EnhancedSciFiTheme, GlowButton, PERF_MONITOR
 
 # ============================================================================
 # DETACHABLE WINDOW SYSTEM
@@ -331,6 +331,23 @@ ENSEMBLE METHOD: Weighted voting (30% + 40% + 30%)
 
         self.metrics_text = metrics_text
 
+        # GUI render profiling toggle
+        profile_frame = Frame(perf_frame, bg=EnhancedSciFiTheme.BG_MEDIUM)
+        profile_frame.pack(fill=tk.X, padx=10)
+
+        Label(profile_frame, text="GUI Render Profiling:",
+              font=EnhancedSciFiTheme.FONT_MONO_BOLD,
+              fg=EnhancedSciFiTheme.GREEN_GLOW,
+              bg=EnhancedSciFiTheme.BG_MEDIUM).pack(side=tk.LEFT)
+
+        self.profiling_var = tk.BooleanVar(value=PERF_MONITOR.enabled)
+        Checkbutton(profile_frame, variable=self.profiling_var,
+                   command=self.toggle_render_profiling,
+                   bg=EnhancedSciFiTheme.BG_MEDIUM,
+                   fg=EnhancedSciFiTheme.GREEN_GLOW,
+                   selectcolor=EnhancedSciFiTheme.BG_DARK,
+                   activebackground=EnhancedSciFiTheme.BG_MEDIUM).pack(side=tk.LEFT, padx=10)
+
         # Initial metrics
         self.update_performance_metrics()
 
@@ -591,10 +608,43 @@ THREAT DETECTION:
 ├─ False Positives:         {self.get_false_positives()}
 ├─ True Positives:          {self.get_true_positives()}
 └─ Detection Rate:          {self.get_detection_rate():.2%}
+
+{self.format_render_profile()}
         """
 
         self.metrics_text.insert(tk.END, metrics)
 
+    def toggle_render_profiling(self):
+        """Start or stop recording GUI render statistics"""
+        if self.profiling_var.get():
+            # Each profiling run starts from fresh statistics
+            PERF_MONITOR.reset()
+            PERF_MONITOR.enable()
+        else:
+            PERF_MONITOR.disable()
+        self.update_performance_metrics()
+
+    def format_render_profile(self, limit=12):
+        """Per-widget draw times and canvas item counts, busiest first"""
+        if not PERF_MONITOR.enabled and not PERF_MONITOR.widgets:
+            return "GUI RENDER PROFILE:\n└─ Profiling disabled"
+
+        lines = ["GUI RENDER PROFILE:"]
+        for row in PERF_MONITOR.snapshot()[:limit]:
+            status = "" if row['alive'] else "  [destroyed]"
+            lines.append(f"├─ {row['widget']}{status}")
+            for name, stats in row['callbacks'].items():
+                lines.append(f"│    {name:<22} calls {stats['calls']:>7}  "
+                             f"p50 {stats['p50']:6.2f}ms  p95 {stats['p95']:6.2f}ms  "
+                             f"p99 {stats['p99']:6.2f}ms")
+            if row['items'] is not None:
+                lines.append(f"│    items {row['items']} (peak {row['peak_items']}, "
+                             f"{row['item_growth_per_min']:+.1f}/min)  "
+                             f"created {row['created_per_sec']:.1f}/s  "
+                             f"deleted {row['deleted_per_sec']:.1f}/s")
+        lines.append(f"└─ Widgets profiled:        {len(PERF_MONITOR.widgets)}")
+        return "\n".join(lines)
+
     # Helper methods for metrics (return mock data for now)
     def get_training_iterations(self):
         return 42 if self.neural_detector else 0
@@ -17,6 +17,7 @@ Version: 3.0.0-ENHANCED-GUI-UNIFIED
 
 import sys
 import os
+import argparse
 
 # Add current directory to path for imports
 sys.path.insert(0, '/home/cdavenport795/ARCHITECT SYSTEM')
@@ -34,6 +35,7 @@ print("[1/4] Loading Enhanced Theme System and Animated Widgets...")
 try:
     exec(open('/home/cdavenport795/ARCHITECT SYSTEM/ARCHITECT_SA_v3.0_ENHANCED_GUI_PART1.py').read())
     print("      ✓ EnhancedSciFiTheme loaded")
+    print("      ✓ FrameScheduler loaded")
     print("      ✓ AnimatedBorderFrame loaded")
     print("      ✓ ScanlineCanvas loaded")
     print("      ✓ DataStreamWidget loaded")
@@ -55,7 +57,7 @@ try:
         part2_code = f.read()
 
     # Remove the import statement that causes issues and the test code at bottom
-    part2_code = part2_code.replace("from ARCHITECT_SA_v3_0_ENHANCED_GUI_PART1 import EnhancedSciFiTheme", "")
+    part2_code = part2_code.replace("from ARCHITECT_SA_v3_0_ENHANCED_GUI_PART1 import (EnhancedSciFiTheme, FrameScheduler, FrameRateGovernor,\n                                                  LatestWinsMailbox, instrumented)", "")
 
     # Remove test code (everything after "# Test components")
     if '# Test components' in part2_code:
@@ -82,7 +84,7 @@ try:
         part3_code = f.read()
 
     # Remove the import statement and test code
-    part3_code = part3_code.replace("from ARCHITECT_SA_v3_0_ENHANCED_GUI_PART1 import EnhancedSciFiTheme, GlowButton", "")
+    part3_code = part3_code.replace("from ARCHITECT_SA_v3_0_ENHANCED_GUI_PART1 import EnhancedSciFiTheme, GlowButton, PERF_MONITOR", "")
 
     # Remove test code (everything after "# Test")
     if '# Test' in part3_code:
@@ -558,6 +560,9 @@ class EnhancedArchitectMainWindow(tk.Tk):
         # Detached windows tracker
         self.detached_windows = []
 
+        # Render statistics dump (see --perf-dump)
+        self.perf_dump_path = None
+
         # Handle close
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
 
@@ -602,15 +607,18 @@ class EnhancedArchitectMainWindow(tk.Tk):
 
         GlowButton(btn_frame, text="NEURAL CONTROL",
                   command=self.open_neural_control,
-                  width=150, height=35).pack(side=tk.LEFT, padx=5)
+                  width=150, height=35,
+                  shared_glow=True).pack(side=tk.LEFT, padx=5)
 
         GlowButton(btn_frame, text="ADVANCED CONFIG",
                   command=self.open_advanced_config,
-                  width=150, height=35).pack(side=tk.LEFT, padx=5)
+                  width=150, height=35,
+                  shared_glow=True).pack(side=tk.LEFT, padx=5)
 
         GlowButton(btn_frame, text="DETACH NEURAL VIZ",
                   command=self.detach_neural_viz,
-                  width=150, height=35).pack(side=tk.LEFT, padx=5)
+                  width=150, height=35,
+                  shared_glow=True).pack(side=tk.LEFT, padx=5)
 
         # Tab control
         self.notebook = ttk.Notebook(self)
@@ -683,6 +691,21 @@ class EnhancedArchitectMainWindow(tk.Tk):
         viz.pack(pady=10)
         self.detached_windows.append(window)
 
+    def start_perf_dump(self, path, interval_s):
+        """Profile rendering and rewrite the statistics to path periodically"""
+        self.perf_dump_path = path
+        PERF_MONITOR.enable()
+
+        def dump():
+            try:
+                PERF_MONITOR.dump_json(path)
+            except OSError as e:
+                logger.error(f"Render profile dump failed: {e}")
+                return
+            self.after(int(interval_s * 1000), dump)
+
+        self.after(int(interval_s * 1000), dump)
+
     def on_closing(self):
         """Handle window close"""
         if messagebox.askokcancel("Exit ARCHITECT",
@@ -705,6 +728,12 @@ class EnhancedArchitectMainWindow(tk.Tk):
                 except:
                     pass
 
+            if self.perf_dump_path:
+                try:
+                    PERF_MONITOR.dump_json(self.perf_dump_path)
+                except OSError as e:
+                    logger.error(f"Render profile dump failed: {e}")
+
             logger.info("ARCHITECT Enhanced terminated")
             self.destroy()
 
@@ -712,8 +741,20 @@ class EnhancedArchitectMainWindow(tk.Tk):
 # MAIN ENTRY POINT
 # ============================================================================
 
+def parse_args():
+    """Command line options"""
+    parser = argparse.ArgumentParser(description="ARCHITECT v3.0 Enhanced GUI System")
+    parser.add_argument('--profile', action='store_true',
+                        help="record per-widget draw times and canvas item counts")
+    parser.add_argument('--perf-dump', metavar='PATH',
+                        help="write render statistics as JSON to PATH (implies --profile)")
+    parser.add_argument('--perf-dump-interval', metavar='SECONDS', type=float, default=10.0,
+                        help="how often --perf-dump rewrites the file (default: 10)")
+    return parser.parse_args()
+
 def main():
     """Main entry point"""
+    args = parse_args()
     try:
         print("\n✓ All components loaded successfully!")
         print("\nLaunching ARCHITECT v3.0 Enhanced GUI System...")
@@ -722,6 +763,10 @@ def main():
         logger.info("Starting ARCHITECT v3.0 Enhanced GUI System")
 
         app = EnhancedArchitectMainWindow()
+        if args.profile:
+            PERF_MONITOR.enable()
+        if args.perf_dump:
+            app.start_perf_dump(args.perf_dump, args.perf_dump_interval)
         app.mainloop()
 
     except KeyboardInterrupt:
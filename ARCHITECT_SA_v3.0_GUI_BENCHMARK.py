@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+"""
+ARCHITECT SYSTEM v3.0 - ENHANCED SCI-FI GUI BENCHMARK
+Headless rendering benchmark for the Part 1 and Part 2 widgets
+
+Every scenario builds one kind of widget under a parameterized load
+(N threats, M nodes, K streams, ...) and draws it back to back: one frame
+is the scenario's driver step, every scheduler callback the widget has
+subscribed, and the idle redraw Tk performs for it. Results are printed as
+JSON so runs of different builds can be diffed.
+
+Usage:
+    python ARCHITECT_SA_v3.0_GUI_BENCHMARK.py                      # everything
+    python ARCHITECT_SA_v3.0_GUI_BENCHMARK.py --scenario threat_map --sizes 100,1000
+    python ARCHITECT_SA_v3.0_GUI_BENCHMARK.py --list
+
+Without a DISPLAY a private Xvfb server is started for the run.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import random
+import select
+import shutil
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PART1_PATH = os.path.join(HERE, 'ARCHITECT_SA_v3.0_ENHANCED_GUI_PART1.py')
+PART2_PATH = os.path.join(HERE, 'ARCHITECT_SA_v3.0_ENHANCED_GUI_PART2.py')
+
+# ============================================================================
+# VIRTUAL DISPLAY
+# ============================================================================
+
+def start_virtual_display(screen="3840x2160x24", timeout=10.0):
+    """Start Xvfb on a free display number and point DISPLAY at it"""
+    xvfb = shutil.which('Xvfb')
+    if xvfb is None:
+        raise SystemExit("No X display available and Xvfb is not installed "
+                         "(install the xvfb package or set DISPLAY)")
+
+    # Xvfb picks a free display itself and reports it on -displayfd
+    read_fd, write_fd = os.pipe()
+    process = subprocess.Popen([xvfb, '-displayfd', str(write_fd), '-screen', '0', screen,
+                                '-nolisten', 'tcp'],
+                               pass_fds=(write_fd,),
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.close(write_fd)
+
+    display = b''
+    deadline = time.monotonic() + timeout
+    while not display.endswith(b'\n') and time.monotonic() < deadline:
+        ready, _, _ = select.select([read_fd], [], [], 0.1)
+        if ready:
+            chunk = os.read(read_fd, 16)
+            if not chunk:
+                break
+            display += chunk
+    os.close(read_fd)
+
+    if not display.strip():
+        process.terminate()
+        raise SystemExit("Xvfb did not report a display")
+
+    os.environ['DISPLAY'] = ':' + display.decode().strip()
+    return process
+
+# ============================================================================
+# WIDGET MODULES
+# ============================================================================
+
+def load_parts():
+    """Import Part 1 and Part 2 under the module names Part 2 imports from"""
+    modules = []
+    for name, path in (('ARCHITECT_SA_v3_0_ENHANCED_GUI_PART1', PART1_PATH),
+                       ('ARCHITECT_SA_v3_0_ENHANCED_GUI_PART2', PART2_PATH)):
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        modules.append(module)
+    return modules
+
+# ============================================================================
+# SCENARIOS
+# ============================================================================
+
+class Scenario:
+    """One widget type and the load parameter it is benchmarked over"""
+
+    def __init__(self, name, parameter, sizes, setup):
+        self.name = name
+        self.parameter = parameter
+        self.sizes = sizes
+        self.setup = setup  # (parts, parent, size) -> step(frame)
+
+
+def random_ip():
+    """Random dotted-quad address"""
+    return '.'.join(str(random.randint(1, 254)) for _ in range(4))
+
+
+def grid_widgets(widgets, columns=10):
+    """Lay widgets out in rows so large counts stay on screen"""
+    for index, widget in enumerate(widgets):
+        widget.grid(row=index // columns, column=index % columns, padx=2, pady=2)
+
+
+def setup_circular_gauge(parts, parent, count):
+    P1, _ = parts
+    gauges = [P1.CircularGauge(parent, label=f"G{i}", size=120) for i in range(count)]
+    grid_widgets(gauges)
+
+    def step(frame):
+        for i, gauge in enumerate(gauges):
+            gauge.set_value((frame * 7 + i * 13) % 100)
+    return step
+
+
+def setup_glow_button(parts, parent, count):
+    P1, _ = parts
+    buttons = [P1.GlowButton(parent, text=f"BUTTON {i}", width=150, height=40)
+               for i in range(count)]
+    grid_widgets(buttons)
+
+    def step(frame):
+        # Hover one button per frame, the way a pointer sweeping the row would
+        button = buttons[frame % count]
+        button.is_hovered = not button.is_hovered
+        button.draw_button()
+    return step
+
+
+def setup_animated_border(parts, parent, count):
+    P1, _ = parts
+    frames = []
+    for i in range(count):
+        frame = P1.AnimatedBorderFrame(parent, width=200, height=120)
+        # Keep the requested size instead of shrinking to the inner canvas
+        frame.pack_propagate(False)
+        P1.Label(frame.inner_frame, text=f"PANEL {i}", bg=P1.EnhancedSciFiTheme.BG_DARK,
+                 fg=P1.EnhancedSciFiTheme.TEXT_PRIMARY).pack(padx=10, pady=10)
+        frame.start_animation()
+        frames.append(frame)
+    grid_widgets(frames)
+    return lambda frame: None
+
+
+def setup_scanline(parts, parent, trail_length):
+    P1, _ = parts
+    P1.ScanlineCanvas(parent, trail_length=trail_length, width=800, height=600,
+                      bg=P1.EnhancedSciFiTheme.BG_BLACK).pack()
+    return lambda frame: None
+
+
+def setup_data_stream(parts, parent, streams):
+    P1, _ = parts
+    P1.DataStreamWidget(parent, stream_count=streams, width=max(400, streams * 12),
+                        height=400).pack()
+    return lambda frame: None
+
+
+def setup_hex_display(parts, parent, rows):
+    P1, _ = parts
+    P1.HexDisplayPanel(parent, width=700,
+                       height=rows * P1.HexDisplayPanel.LINE_HEIGHT).pack()
+    return lambda frame: None
+
+
+def setup_neural_network(parts, parent, neurons):
+    _, P2 = parts
+    layers = [20, neurons, max(1, neurons // 2), 8]
+    viz = P2.NeuralNetworkVisualization(parent, layers=layers, width=900, height=600)
+    viz.pack()
+
+    def step(frame):
+        viz.set_activations({(1, i): random.random() for i in range(min(neurons, 16))})
+    return step
+
+
+def setup_neural_network_raster(parts, parent, neurons):
+    _, P2 = parts
+    layers = [20, neurons, max(1, neurons // 2), 8]
+    viz = P2.NeuralNetworkVisualization(parent, layers=layers, width=900, height=600,
+                                        backend='raster')
+    viz.pack()
+
+    def step(frame):
+        viz.set_activations([None, np.random.rand(neurons)])
+    return step
+
+
+def setup_threat_map(parts, parent, threats):
+    _, P2 = parts
+    threat_map = P2.ThreatMapVisualization(parent, width=900, height=600, max_threats=threats)
+    threat_map.pack()
+    for _ in range(threats):
+        threat_map.add_threat(random_ip(), random.randint(1, 10))
+
+    def step(frame):
+        threat_map.add_threat(random_ip(), random.randint(1, 10))
+    return step
+
+
+def setup_network_topology(parts, parent, nodes):
+    _, P2 = parts
+    topology = P2.NetworkTopologyVisualization(parent, width=900, height=600)
+    topology.pack()
+
+    ips = [f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}" for i in range(nodes)]
+    for i, ip in enumerate(ips):
+        topology.add_node(ip, 'gateway' if i == 0 else 'host')
+    for _ in range(nodes * 2):
+        topology.add_connection(random.choice(ips), random.choice(ips))
+
+    def step(frame):
+        topology.add_connection(random.choice(ips), random.choice(ips))
+    return step
+
+
+def setup_realtime_graph(parts, parent, points):
+    _, P2 = parts
+    graph = P2.RealTimeGraph(parent, max_points=points, width=800, height=300)
+    graph.pack()
+
+    def step(frame):
+        graph.add_data_point(50 + 40 * np.sin(frame * 0.1))
+    return step
+
+
+def setup_matrix_rain(parts, parent, width):
+    _, P2 = parts
+    rain = P2.MatrixRainBackground(parent, width=width, height=600)
+    rain.pack()
+    rain.start()
+    return lambda frame: None
+
+
+SCENARIOS = [
+    Scenario('circular_gauge', 'gauges', (1, 10, 50), setup_circular_gauge),
+    Scenario('glow_button', 'buttons', (1, 10, 50), setup_glow_button),
+    Scenario('animated_border', 'frames', (1, 10, 50), setup_animated_border),
+    Scenario('scanline', 'trail_length', (0, 4, 16), setup_scanline),
+    Scenario('data_stream', 'streams', (10, 50, 200), setup_data_stream),
+    Scenario('hex_display', 'rows', (10, 40, 120), setup_hex_display),
+    Scenario('neural_network', 'neurons', (16, 64, 256), setup_neural_network),
+    Scenario('neural_network_raster', 'neurons', (16, 64, 256), setup_neural_network_raster),
+    Scenario('threat_map', 'threats', (10, 100, 1000), setup_threat_map),
+    Scenario('network_topology', 'nodes', (10, 100, 500), setup_network_topology),
+    Scenario('realtime_graph', 'points', (100, 1000, 5000), setup_realtime_graph),
+    Scenario('matrix_rain', 'width', (400, 1280, 2560), setup_matrix_rain),
+]
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def descendants(widget):
+    """A widget and every widget below it"""
+    found = [widget]
+    for child in widget.winfo_children():
+        found.extend(descendants(child))
+    return found
+
+
+def percentile(ordered, fraction):
+    """Nearest-rank percentile of an ascending list"""
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run_case(parts, scenario, size, duration, warmup, settle=0.3):
+    """Benchmark one scenario at one load size"""
+    import tkinter as tk
+    P1, _ = parts
+
+    random.seed(0)
+    np.random.seed(0)
+
+    root = tk.Tk()
+    root.title(f"benchmark: {scenario.name} {scenario.parameter}={size}")
+    parent = tk.Frame(root, bg=P1.EnhancedSciFiTheme.BG_BLACK)
+    parent.pack(fill=tk.BOTH, expand=True)
+
+    step = scenario.setup(parts, parent, size)
+
+    # Let deferred initialisation (after() one-shots, first layout) finish
+    settle_until = time.perf_counter() + settle
+    while time.perf_counter() < settle_until:
+        root.update()
+
+    scheduler = P1.FrameScheduler.for_widget(root)
+    widgets = set(descendants(parent))
+    canvases = [w for w in widgets if isinstance(w, tk.Canvas)]
+
+    def probe_ids():
+        ids = []
+        for canvas in canvases:
+            probe = canvas.create_line(0, 0, 0, 0)
+            canvas.delete(probe)
+            ids.append(probe)
+        return ids
+
+    latencies = []
+    peak_items = 0
+    frame = 0
+    # Measurement starts here, or again after the last warmup frame
+    start_probes = probe_ids()
+    started = time.perf_counter()
+
+    while True:
+        frame_start = time.perf_counter()
+        step(frame)
+        for subscription in [s for s in scheduler.subscriptions if s.owner in widgets]:
+            if subscription.active:
+                subscription.callback()
+        root.update_idletasks()
+        frame_end = time.perf_counter()
+        frame += 1
+
+        if frame <= warmup:
+            if frame == warmup:
+                start_probes = probe_ids()
+                started = time.perf_counter()
+            continue
+
+        latencies.append((frame_end - frame_start) * 1000.0)
+        peak_items = max(peak_items, sum(len(c.find_all()) for c in canvases))
+        if time.perf_counter() - started >= duration:
+            break
+
+    end_probes = probe_ids()
+    created = sum(end - start - 1 for start, end in zip(start_probes, end_probes))
+    root.destroy()
+
+    ordered = sorted(latencies)
+    mean_ms = sum(ordered) / len(ordered)
+    return {
+        'scenario': scenario.name,
+        'parameter': scenario.parameter,
+        'size': size,
+        'frames': len(ordered),
+        # Frames per second the widget sustains when drawing back to back
+        'fps': round(1000.0 / mean_ms, 2) if mean_ms > 0 else None,
+        'latency_ms': {
+            'mean': round(mean_ms, 3),
+            'p50': round(percentile(ordered, 0.50), 3),
+            'p95': round(percentile(ordered, 0.95), 3),
+            'p99': round(percentile(ordered, 0.99), 3),
+            'max': round(ordered[-1], 3),
+        },
+        'peak_items': peak_items,
+        'items_created_per_frame': round(created / len(ordered), 2),
+    }
+
+
+def git_revision():
+    """Short commit hash of the tree being benchmarked, if it is a git checkout"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=HERE,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+# ============================================================================
+# MAIN ENTRY POINT
+# ============================================================================
+
+def parse_args():
+    """Command line options"""
+    names = [scenario.name for scenario in SCENARIOS]
+    parser = argparse.ArgumentParser(description="ARCHITECT v3.0 GUI rendering benchmark")
+    parser.add_argument('--scenario', action='append', choices=names, metavar='NAME',
+                        help="scenario to run (repeatable; default: all)")
+    parser.add_argument('--sizes', metavar='N,N,...',
+                        help="load sizes to run instead of each scenario's defaults")
+    parser.add_argument('--duration', type=float, default=2.0, metavar='SECONDS',
+                        help="measured time per case (default: 2)")
+    parser.add_argument('--warmup', type=int, default=10, metavar='FRAMES',
+                        help="unmeasured frames before each case (default: 10)")
+    parser.add_argument('--output', metavar='PATH',
+                        help="write the JSON report to PATH instead of stdout")
+    parser.add_argument('--xvfb', action='store_true',
+                        help="use a private Xvfb server even if DISPLAY is set")
+    parser.add_argument('--list', action='store_true',
+                        help="list scenarios and their default sizes")
+    return parser.parse_args()
+
+
+def main():
+    """Main entry point"""
+    args = parse_args()
+
+    if args.list:
+        for scenario in SCENARIOS:
+            sizes = ','.join(str(size) for size in scenario.sizes)
+            print(f"{scenario.name:<22} {scenario.parameter}={sizes}")
+        return
+
+    scenarios = [s for s in SCENARIOS if not args.scenario or s.name in args.scenario]
+    sizes = [int(size) for size in args.sizes.split(',')] if args.sizes else None
+
+    xvfb = start_virtual_display() if args.xvfb or not os.environ.get('DISPLAY') else None
+    try:
+        parts = load_parts()
+
+        results = []
+        for scenario in scenarios:
+            for size in sizes or scenario.sizes:
+                print(f"  {scenario.name} {scenario.parameter}={size} ...",
+                      file=sys.stderr, flush=True)
+                results.append(run_case(parts, scenario, size, args.duration, args.warmup))
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+            xvfb.wait()
+
+    import tkinter as tk
+    report = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'tk': tk.TkVersion,
+        'platform': platform.platform(),
+        'duration_s': args.duration,
+        'warmup_frames': args.warmup,
+        'results': results,
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()